@@ -0,0 +1,125 @@
+from typing import Any, Callable
+from argparse import ArgumentParser
+from functools import partial
+from multiprocessing import Process
+from tempfile import TemporaryDirectory
+from time import perf_counter, sleep
+import os
+
+from datocms.client import CacheBackend, MemoryCache, SQLiteCache, RedisCache
+
+from .fixtures import records_page
+from .redis_server import serve_redis
+
+
+def check_basics(cache: CacheBackend):
+    cache.clear()
+    assert cache.get("missing", "default") == "default"
+    cache.set("a", {"id": "1"})
+    assert cache.get("a") == {"id": "1"}
+    cache.delete("a")
+    assert cache.get("a") is None
+
+    cache.set("short", 1, ttl=0.05)
+    cache.set("long", 2, ttl=60)
+    sleep(0.1)
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+    cache.set("x", 1, tags=("t1",))
+    cache.set("y", 2, tags=("t1", "t2"))
+    cache.set("z", 3, tags=("t3",))
+    assert cache.purge("t1") == 2
+    assert cache.get("x") is None and cache.get("y") is None
+    assert cache.get("z") == 3
+
+    cache.clear()
+    assert cache.get("z") is None and cache.get("long") is None
+
+
+def check_lru(cache: CacheBackend):
+    # the caches are built with maxsize=3
+    cache.clear()
+    for key in ("k0", "k1", "k2"):
+        cache.set(key, key)
+        sleep(0.01)
+    assert cache.get("k0") == "k0"
+    sleep(0.01)
+    cache.set("k3", "k3")
+    assert cache.get("k1") is None
+    assert [cache.get(key) for key in ("k0", "k2", "k3")] == ["k0", "k2", "k3"]
+
+
+def _fill(make: Callable[[], CacheBackend], worker: int, count: int):
+    cache = make()
+    for n in range(count):
+        cache.set(f"{worker}:{n}", (os.getpid(), n), tags=(f"w{worker}",))
+
+
+def check_shared(make: Callable[[], CacheBackend], workers: int = 4, count: int = 50):
+    cache = make()
+    cache.clear()
+    children = [
+        Process(target=_fill, args=(make, worker, count)) for worker in range(workers)
+    ]
+    for child in children:
+        child.start()
+    for child in children:
+        child.join()
+        assert child.exitcode == 0
+    pids = set()
+    for worker in range(workers):
+        for n in range(count):
+            pid, value = cache.get(f"{worker}:{n}")
+            assert value == n
+            pids.add(pid)
+    assert len(pids) == workers and os.getpid() not in pids
+    assert cache.purge("w0") == count
+    assert cache.get("0:0") is None and cache.get("1:0") is not None
+
+
+def measure(cache: CacheBackend, value: Any, repeat: int) -> tuple[float, float]:
+    started = perf_counter()
+    for n in range(repeat):
+        cache.set(f"bench:{n}", value)
+    sets = perf_counter() - started
+    started = perf_counter()
+    for n in range(repeat):
+        cache.get(f"bench:{n}")
+    gets = perf_counter() - started
+    return sets / repeat, gets / repeat
+
+
+def main():
+    parser = ArgumentParser(description="cache backend checks and get/set cost")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    value = records_page(args.page_size)
+    with TemporaryDirectory() as directory, serve_redis() as redis:
+        path = os.path.join(directory, "cache.sqlite")
+        backends: list[tuple[str, Callable[..., CacheBackend], bool]] = [
+            ("memory", MemoryCache, False),
+            ("sqlite", partial(SQLiteCache, path), True),
+            ("redis", partial(RedisCache, redis), True),
+        ]
+
+        for name, make, shared in backends:
+            check_basics(make())
+            if name != "redis":
+                check_lru(make(maxsize=3))
+            if shared:
+                check_shared(make)
+            print(f"{name}: checks passed")
+
+        print(f"{'backend':<8} {'set ms':>8} {'get ms':>8}")
+        for name, make, _ in backends:
+            cache = make()
+            cache.clear()
+            sets, gets = measure(cache, value, args.repeat)
+            print(f"{name:<8} {sets * 1000:>8.3f} {gets * 1000:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
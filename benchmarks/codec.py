@@ -0,0 +1,48 @@
+from argparse import ArgumentParser
+from functools import partial
+from timeit import Timer
+
+from datocms.client import StdlibCodec, OrjsonCodec, MsgspecCodec
+
+from .fixtures import records_page, uploads_page
+
+
+def available_codecs():
+    for codec in (StdlibCodec, OrjsonCodec, MsgspecCodec):
+        try:
+            yield codec.__name__, codec()
+        except ImportError:
+            print(f"{codec.__name__}: not installed, skipped")
+
+
+def measure(func, repeat: int) -> float:
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def main():
+    parser = ArgumentParser(description="JSON codec decode/encode cost per page")
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    stdlib = StdlibCodec()
+    pages = {
+        "records": stdlib.dumps(records_page(args.page_size)),
+        "uploads": stdlib.dumps(uploads_page(args.page_size)),
+    }
+    print(f"{'codec':<14} {'page':<8} {'KiB':>6} {'loads ms':>9} {'dumps ms':>9}")
+    for name, codec in available_codecs():
+        for page, body in pages.items():
+            decoded = codec.loads(body)
+            loads = measure(partial(codec.loads, body), args.repeat)
+            dumps = measure(partial(codec.dumps, decoded), args.repeat)
+            print(
+                f"{name:<14} {page:<8} {len(body) / 1024:>6.0f}"
+                f" {loads * 1000:>9.2f} {dumps * 1000:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+from typing import Any
+
+
+__all__ = [
+    "make_record",
+    "make_upload",
+    "make_model",
+    "make_field",
+    "make_tag",
+    "make_job_result",
+    "make_graphql_result",
+    "records_page",
+    "uploads_page",
+]
+
+
+LOCALES = ("en", "de", "fr")
+
+
+def make_record(i: int, /, model: str = "1") -> dict[str, Any]:
+    return {
+        "id": str(100_000 + i),
+        "type": "item",
+        "attributes": {
+            "title": {locale: f"Record {i} ({locale})" for locale in LOCALES},
+            "slug": f"record-{i}",
+            "position": i,
+            "published": i % 2 == 0,
+            "body": {
+                "schema": "dast",
+                "document": {
+                    "type": "root",
+                    "children": [
+                        {
+                            "type": "paragraph",
+                            "children": [{"type": "span", "value": "Lorem ipsum " * 8}],
+                        }
+                    ],
+                },
+            },
+            "cover": {"upload_id": str(200_000 + i), "alt": None, "title": None},
+            "tags": [str(300_000 + i % 50), str(300_000 + i % 7)],
+        },
+        "meta": {
+            "created_at": "2024-01-01T00:00:00.000+00:00",
+            "updated_at": f"2024-01-01T00:00:{i % 60:02d}.000+00:00",
+            "published_at": "2024-01-01T00:00:00.000+00:00",
+            "first_published_at": "2024-01-01T00:00:00.000+00:00",
+            "publication_scheduled_at": None,
+            "unpublishing_scheduled_at": None,
+            "status": "published",
+            "is_current_version_valid": True,
+            "is_published_version_valid": True,
+            "current_version": f"v{i}",
+            "stage": None,
+            "is_valid": True,
+        },
+        "relationships": {
+            "item_type": {"data": {"id": model, "type": "item_type"}},
+            "creator": {"data": {"id": "1000", "type": "account"}},
+        },
+    }
+
+
+def make_upload(i: int, /) -> dict[str, Any]:
+    return {
+        "id": str(200_000 + i),
+        "type": "upload",
+        "attributes": {
+            "size": 100_000 + i,
+            "width": 1920,
+            "height": 1080,
+            "path": f"/1000/{i}-image.jpg",
+            "basename": f"{i}-image",
+            "filename": f"{i}-image.jpg",
+            "url": f"https://www.datocms-assets.com/1000/{i}-image.jpg",
+            "format": "jpg",
+            "author": None,
+            "copyright": None,
+            "notes": None,
+            "md5": f"{i:032x}",
+            "duration": None,
+            "frame_rate": None,
+            "blurhash": "LEHV6nWB2yk8pyo0adR*.7kCMdnj",
+            "mux_playback_id": None,
+            "mux_mp4_highest_res": None,
+            "default_field_metadata": {
+                locale: {
+                    "alt": f"Image {i}",
+                    "title": None,
+                    "custom_data": {},
+                    "focal_point": None,
+                }
+                for locale in LOCALES
+            },
+            "is_image": True,
+            "created_at": "2024-01-01T00:00:00.000+00:00",
+            "updated_at": "2024-01-01T00:00:00.000+00:00",
+            "mime_type": "image/jpeg",
+            "tags": ["photo", "hero"],
+            "smart_tags": ["outdoor", "sky"],
+            "exif_info": {},
+            "colors": [{"red": 10, "green": 20, "blue": 30, "alpha": 255}] * 4,
+        },
+        "relationships": {
+            "creator": {"data": {"id": "1000", "type": "account"}},
+            "upload_collection": {"data": None},
+        },
+    }
+
+
+def make_model(i: int, /, fields: int = 10) -> dict[str, Any]:
+    return {
+        "id": str(i),
+        "type": "item_type",
+        "attributes": {
+            "name": f"Model {i}",
+            "api_key": f"model_{i}",
+            "singleton": False,
+            "sortable": False,
+            "modular_block": False,
+            "tree": False,
+            "draft_mode_active": False,
+            "all_locales_required": False,
+            "collection_appearance": "table",
+            "has_singleton_item": False,
+        },
+        "relationships": {
+            "fields": {
+                "data": [
+                    {"id": f"{i}{n:03d}", "type": "field"} for n in range(fields)
+                ]
+            },
+            "field_sets": {"data": []},
+        },
+    }
+
+
+def make_field(model: str, n: int, /) -> dict[str, Any]:
+    return {
+        "id": f"{model}{n:03d}",
+        "type": "field",
+        "attributes": {
+            "label": f"Field {n}",
+            "field_type": "string",
+            "api_key": f"field_{n}",
+            "localized": n % 2 == 0,
+            "validators": {},
+            "appearance": {"editor": "single_line", "parameters": {}, "addons": []},
+            "position": n,
+            "hint": None,
+            "default_value": None,
+        },
+        "relationships": {
+            "item_type": {"data": {"id": model, "type": "item_type"}},
+            "fieldset": {"data": None},
+        },
+    }
+
+
+def make_tag(i: int, /) -> dict[str, Any]:
+    return {"id": f"tag-{i}", "type": "upload_tag", "attributes": {"name": f"tag-{i}"}}
+
+
+def make_job_result(id: str, payload: Any, /, status: int = 200) -> dict[str, Any]:
+    return {
+        "id": id,
+        "type": "job_result",
+        "attributes": {"status": status, "payload": payload},
+    }
+
+
+def make_graphql_result(records: int = 100, /) -> dict[str, Any]:
+    return {
+        "data": {
+            "allRecords": [
+                {
+                    "id": str(100_000 + i),
+                    "title": f"Record {i}",
+                    "slug": f"record-{i}",
+                    "_updatedAt": "2024-01-01T00:00:00+00:00",
+                }
+                for i in range(records)
+            ]
+        }
+    }
+
+
+def records_page(size: int = 500, offset: int = 0, total: int | None = None):
+    return {
+        "data": [make_record(offset + i) for i in range(size)],
+        "meta": {"total_count": total or offset + size},
+    }
+
+
+def uploads_page(size: int = 500, offset: int = 0, total: int | None = None):
+    return {
+        "data": [make_upload(offset + i) for i in range(size)],
+        "meta": {"total_count": total or offset + size},
+    }
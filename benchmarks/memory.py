@@ -0,0 +1,63 @@
+from argparse import ArgumentParser
+from time import perf_counter
+from gc import collect
+import tracemalloc
+
+from datocms.client import StdlibCodec, InterningCodec
+from datocms.client.codec import default_codec
+from datocms.compact import Record, decode_list
+
+from .fixtures import records_page
+
+
+def pages(records: int, page_size: int):
+    encoder = StdlibCodec()
+    for offset in range(0, records, page_size):
+        size = min(page_size, records - offset)
+        yield encoder.dumps(records_page(size, offset, total=records))
+
+
+def decoders():
+    yield "dict", lambda body: default_codec().loads(body)["data"]
+
+    interning = InterningCodec()
+    yield "dict+intern", lambda body: interning.loads(body)["data"]
+
+    loads = default_codec().loads
+    yield "compact", lambda body: decode_list(body, Record, loads)[0]
+
+    interning = InterningCodec()
+    yield "compact+intern", lambda body: decode_list(
+        body, Record, interning.loads, direct=False
+    )[0]
+
+
+def main():
+    parser = ArgumentParser(description="memory held by decoded records")
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'mode':<16} {'MiB':>8} {'bytes/record':>13} {'decode s':>9}")
+    for name, decode in decoders():
+        collect()
+        tracemalloc.start()
+        items, elapsed = [], 0.0
+        for body in pages(args.records, args.page_size):
+            started = perf_counter()
+            items.extend(decode(body))
+            elapsed += perf_counter() - started
+            del body
+        collect()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert len(items) == args.records
+        print(
+            f"{name:<16} {current / 2**20:>8.1f}"
+            f" {current / args.records:>13.0f} {elapsed:>9.2f}"
+        )
+        del items
+
+
+if __name__ == "__main__":
+    main()
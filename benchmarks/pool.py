@@ -0,0 +1,38 @@
+from argparse import ArgumentParser
+from time import perf_counter
+
+from httpx import Limits
+
+from datocms.client import Client
+
+from .server import serve, local_client
+
+
+def main():
+    parser = ArgumentParser(description="iter_records throughput vs pool size")
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--pools", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    args = parser.parse_args()
+
+    with serve(latency=args.latency, records=args.records) as url:
+        LocalClient = local_client(Client, url)
+        print(f"{'pool':>6} {'seconds':>8} {'records/s':>10}")
+        for pool in args.pools:
+            limits = Limits(max_connections=pool, max_keepalive_connections=pool)
+            with LocalClient("token", limits=limits) as client:
+                started = perf_counter()
+                count = sum(
+                    1
+                    for _ in client.iter_records(
+                        page_size=args.page_size, concurrency=pool
+                    )
+                )
+                elapsed = perf_counter() - started
+            assert count == args.records
+            print(f"{pool:>6} {elapsed:>8.3f} {count / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+from typing import Any, Iterator
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
+from multiprocessing.managers import BaseManager
+from threading import Lock
+from time import monotonic
+
+
+__all__ = ["FakeRedis", "serve_redis"]
+
+
+def _bytes(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode()
+
+
+def _name(name: str | bytes) -> str:
+    return name.decode() if isinstance(name, bytes) else name
+
+
+class FakeRedis:
+    # the part of the redis-py client RedisCache uses, with the same replies
+    def __init__(self):
+        self._values: dict[str, tuple[bytes, float | None]] = {}
+        self._sets: dict[str, set[bytes]] = {}
+        self._lock = Lock()
+
+    def _alive(self, key: str) -> bool:
+        if (entry := self._values.get(key)) is None:
+            return False
+        if entry[1] is not None and entry[1] <= monotonic():
+            del self._values[key]
+            return False
+        return True
+
+    def ping(self) -> bool:
+        return True
+
+    def get(self, name: str) -> bytes | None:
+        with self._lock:
+            return self._values[name][0] if self._alive(name) else None
+
+    def set(self, name: str, value: Any, px: int | None = None) -> bool:
+        expires = None if px is None else monotonic() + px / 1000
+        with self._lock:
+            self._sets.pop(name, None)
+            self._values[name] = (_bytes(value), expires)
+        return True
+
+    def sadd(self, name: str, *values: Any) -> int:
+        with self._lock:
+            members = self._sets.setdefault(name, set())
+            added = {_bytes(value) for value in values} - members
+            members.update(added)
+            return len(added)
+
+    def smembers(self, name: str) -> "set[bytes]":
+        with self._lock:
+            return set(self._sets.get(name, ()))
+
+    def delete(self, *names: str) -> int:
+        removed = 0
+        with self._lock:
+            for name in map(_name, names):
+                if self._alive(name):
+                    del self._values[name]
+                    removed += 1
+                elif self._sets.pop(name, None) is not None:
+                    removed += 1
+        return removed
+
+    def scan_iter(self, match: str | None = None) -> list[bytes]:
+        # a list, the generator redis-py returns does not cross a manager
+        with self._lock:
+            names = [name for name in self._values if self._alive(name)]
+            names.extend(self._sets)
+        return [
+            name.encode() for name in names if match is None or fnmatchcase(name, match)
+        ]
+
+    def flushall(self) -> bool:
+        with self._lock:
+            self._values.clear()
+            self._sets.clear()
+        return True
+
+
+class RedisManager(BaseManager):
+    pass
+
+
+RedisManager.register("FakeRedis", FakeRedis)
+
+
+@contextmanager
+def serve_redis() -> Iterator[FakeRedis]:
+    # the proxy can be handed to other processes, they all share one store
+    with RedisManager() as manager:
+        yield manager.FakeRedis()  # type: ignore[attr-defined]
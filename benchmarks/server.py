@@ -0,0 +1,260 @@
+from typing import Any, Callable, Iterator
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from multiprocessing import Process, Queue
+from threading import Lock, Thread
+from urllib.parse import urlsplit, parse_qs
+from itertools import count
+from hashlib import sha1
+from time import monotonic, sleep
+import json
+import re
+
+from .fixtures import (
+    make_record,
+    make_upload,
+    make_model,
+    make_field,
+    make_tag,
+    make_job_result,
+    make_graphql_result,
+)
+
+
+__all__ = ["FakeDato", "serve", "local_client"]
+
+
+def _error(code: str) -> dict[str, Any]:
+    return {
+        "data": [
+            {
+                "id": code.lower(),
+                "type": "api_error",
+                "attributes": {"code": code, "details": {}},
+            }
+        ]
+    }
+
+
+class FakeDato(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        records: int = 10_000,
+        uploads: int = 1_000,
+        models: int = 5,
+        fields: int = 10,
+        tags: int = 50,
+        max_page_size: int = 500,
+        job_delay: float = 0.0,
+        graphql_records: int = 100,
+    ):
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.latency = latency
+        self.max_page_size = max_page_size
+        self.job_delay = job_delay
+        self.records = [make_record(i, str(i % models)) for i in range(records)]
+        self.uploads = {
+            upload["id"]: upload for upload in map(make_upload, range(uploads))
+        }
+        self.models = [make_model(i, fields) for i in range(models)]
+        self.fields = {
+            model["id"]: [make_field(model["id"], n) for n in range(fields)]
+            for model in self.models
+        }
+        self.tags = [make_tag(i) for i in range(tags)]
+        self.graphql = json.dumps(make_graphql_result(graphql_records)).encode()
+        self.cache_tags = " ".join(f"t-{i}" for i in range(models))
+        self.jobs: dict[str, tuple[float, Any]] = {}
+        self._ids = count(len(self.uploads))
+        self._lock = Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def next_id(self) -> int:
+        with self._lock:
+            return next(self._ids)
+
+
+class Handler(BaseHTTPRequestHandler):
+    server: FakeDato
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: Any = None, raw: bytes | None = None):
+        content = raw if raw is not None else json.dumps(body).encode()
+        headers = {"Content-Type": "application/json"}
+        if self.headers.get("X-Cache-Tags") == "true":
+            headers["X-Cache-Tags"] = self.server.cache_tags
+        if self.command == "GET" and status == 200:
+            etag = headers["ETag"] = f'"{sha1(content).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                status, content = 304, b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() != "chunked":
+            return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        chunks = []
+        while size := int(self.rfile.readline().split(b";")[0], 16):
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+        self.rfile.readline()
+        return b"".join(chunks)
+
+    def _page(self, query: dict[str, str], data: list[Any]):
+        offset = int(query.get("page[offset]", 0))
+        limit = min(int(query.get("page[limit]", 30)), self.server.max_page_size)
+        if ids := query.get("filter[ids]"):
+            wanted = set(ids.split(","))
+            data = [item for item in data if item["id"] in wanted]
+        self._send(
+            200,
+            {
+                "data": data[offset : offset + limit],
+                "meta": {"total_count": len(data)},
+            },
+        )
+
+    def _dispatch(self, routes: dict[str, Callable[..., None]]):
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        body = self._body()
+        sleep(self.server.latency)
+        for pattern, route in routes.items():
+            if match := re.fullmatch(pattern, url.path):
+                return route(query, body, *match.groups())
+        self._send(404, _error("NOT_FOUND"))
+
+    def do_GET(self):
+        self._dispatch(
+            {
+                "/items": lambda q, _: self._page(q, self.server.records),
+                "/uploads": lambda q, _: self._page(
+                    q, list(self.server.uploads.values())
+                ),
+                "/uploads/([^/]+)": self._get_upload,
+                "/job-results/([^/]+)": self._get_job_result,
+                "/upload-(?:smart-)?tags": lambda q, _: self._page(
+                    q, self.server.tags
+                ),
+                "/upload-collections": lambda q, _: self._send(200, {"data": []}),
+                "/item-types": lambda q, _: self._send(
+                    200, {"data": self.server.models}
+                ),
+                "/item-types/([^/]+)/fields": self._list_fields,
+            }
+        )
+
+    def do_POST(self):
+        self._dispatch(
+            {
+                "/graphql": lambda q, _: self._send(200, raw=self.server.graphql),
+                "/upload-requests": self._create_upload_request,
+                "/uploads": self._create_upload,
+                "/upload-tags": self._create_tag,
+            }
+        )
+
+    def do_PUT(self):
+        self._dispatch({"/s3/.+": lambda q, _: self._send(200, raw=b"")})
+
+    def _get_upload(self, query, body, id: str):
+        if (upload := self.server.uploads.get(id)) is None:
+            return self._send(404, _error("NOT_FOUND"))
+        self._send(200, {"data": upload})
+
+    def _get_job_result(self, query, body, id: str):
+        ready, payload = self.server.jobs.get(id, (None, None))
+        if ready is None or monotonic() < ready:
+            return self._send(404, _error("NOT_FOUND"))
+        self._send(200, {"data": make_job_result(id, payload)})
+
+    def _list_fields(self, query, body, id: str):
+        if (fields := self.server.fields.get(id)) is None:
+            return self._send(404, _error("NOT_FOUND"))
+        self._send(200, {"data": fields})
+
+    def _create_upload_request(self, query, body):
+        filename = json.loads(body)["data"]["attributes"]["filename"]
+        path = f"{self.server.next_id()}/{filename}"
+        self._send(
+            201,
+            {
+                "data": {
+                    "id": path,
+                    "type": "upload_request",
+                    "attributes": {
+                        "url": f"{self.server.url}/s3/{path}",
+                        "request_headers": {},
+                    },
+                }
+            },
+        )
+
+    def _create_upload(self, query, body):
+        attributes = json.loads(body)["data"]["attributes"]
+        upload = make_upload(self.server.next_id())
+        upload["attributes"]["path"] = attributes["path"]
+        self.server.uploads[upload["id"]] = upload
+        job = f"job-{upload['id']}"
+        self.server.jobs[job] = monotonic() + self.server.job_delay, {"data": upload}
+        self._send(202, {"data": {"id": job, "type": "job"}})
+
+    def _create_tag(self, query, body):
+        tag = make_tag(self.server.next_id())
+        tag["attributes"]["name"] = json.loads(body)["data"]["attributes"]["name"]
+        self.server.tags.append(tag)
+        self._send(201, {"data": tag})
+
+
+def _serve_forever(queue: Queue, kwargs: dict[str, Any]):
+    server = FakeDato(**kwargs)
+    queue.put(server.url)
+    server.serve_forever()
+
+
+@contextmanager
+def serve(*, process: bool = False, **kwargs) -> Iterator[str]:
+    # a separate process keeps the server off the GIL and out of tracemalloc
+    if process:
+        queue: Queue = Queue()
+        child = Process(target=_serve_forever, args=(queue, kwargs), daemon=True)
+        child.start()
+        try:
+            yield queue.get()
+        finally:
+            child.terminate()
+            child.join()
+        return
+
+    server = FakeDato(**kwargs)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.url
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def local_client[T](cls: type[T], url: str) -> type[T]:
+    return type(
+        f"Local{cls.__name__}",
+        (cls,),
+        {"base_url": url, "graphql_url": f"{url}/graphql"},
+    )
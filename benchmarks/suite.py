@@ -0,0 +1,126 @@
+from argparse import ArgumentParser, Namespace
+from statistics import mean, median
+from time import perf_counter
+import asyncio
+import tracemalloc
+
+from datocms.client import Client, AsyncClient
+
+from .server import serve, local_client
+
+
+QUERY = "{ allRecords(first: 100) { id title slug _updatedAt } }"
+
+
+def _report(client: str, name: str, value: float, unit: str):
+    print(f"{client:<6} {name:<20} {value:>10.2f} {unit}")
+
+
+def _latencies(client: str, name: str, samples: list[float]):
+    _report(client, f"{name} mean", mean(samples) * 1000, "ms")
+    _report(client, f"{name} p50", median(samples) * 1000, "ms")
+
+
+def run_sync(url: str, args: Namespace):
+    with local_client(Client, url)("token") as client:
+        started = perf_counter()
+        total = sum(
+            1
+            for _ in client.iter_records(
+                page_size=args.page_size, concurrency=args.concurrency
+            )
+        )
+        elapsed = perf_counter() - started
+        assert total == args.records, f"{total} of {args.records} records"
+        _report("sync", "iter_records", total / elapsed, "rec/s")
+
+        tracemalloc.start()
+        for _ in client.iter_records(
+            page_size=args.page_size, concurrency=args.concurrency
+        ):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        _report("sync", "iter peak", peak / 2**20, "MiB")
+
+        samples = []
+        for i in range(args.uploads):
+            started = perf_counter()
+            client.create_upload(f"file-{i}.txt", b"x" * 1024, retry_delay=0.001)
+            samples.append(perf_counter() - started)
+        _latencies("sync", "create_upload", samples)
+
+        samples = []
+        for _ in range(args.queries):
+            started = perf_counter()
+            client.execute(QUERY, {})
+            samples.append(perf_counter() - started)
+        _latencies("sync", "execute", samples)
+
+
+async def run_async(url: str, args: Namespace):
+    async with local_client(AsyncClient, url)("token") as client:
+        started = perf_counter()
+        total = 0
+        async for _ in client.iter_records(
+            page_size=args.page_size, concurrency=args.concurrency
+        ):
+            total += 1
+        elapsed = perf_counter() - started
+        assert total == args.records, f"{total} of {args.records} records"
+        _report("async", "iter_records", total / elapsed, "rec/s")
+
+        tracemalloc.start()
+        async for _ in client.iter_records(
+            page_size=args.page_size, concurrency=args.concurrency
+        ):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        _report("async", "iter peak", peak / 2**20, "MiB")
+
+        samples = []
+        for i in range(args.uploads):
+            started = perf_counter()
+            await client.create_upload(
+                f"file-{i}.txt", b"x" * 1024, retry_delay=0.001
+            )
+            samples.append(perf_counter() - started)
+        _latencies("async", "create_upload", samples)
+
+        samples = []
+        for _ in range(args.queries):
+            started = perf_counter()
+            await client.execute(QUERY, {})
+            samples.append(perf_counter() - started)
+        _latencies("async", "execute", samples)
+
+
+def main():
+    parser = ArgumentParser(description="client hot paths against a local stand-in")
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--max-page-size", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--uploads", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument(
+        "--clients", nargs="+", choices=["sync", "async"], default=["sync", "async"]
+    )
+    args = parser.parse_args()
+
+    with serve(
+        process=True,
+        latency=args.latency,
+        records=args.records,
+        max_page_size=args.max_page_size,
+    ) as url:
+        if "sync" in args.clients:
+            run_sync(url, args)
+        if "async" in args.clients:
+            asyncio.run(run_async(url, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,55 @@
 from ._async import AsyncClient
 from ._sync import Client
+from .checkpoint import Checkpoint
+from .cache import CacheBackend, MemoryCache, SQLiteCache, RedisCache
+from .adaptive import AdaptivePageSize
+from .retry import RetryPolicy
+from .ratelimit import RateLimiter, TokenBucket, FileTokenBucket
+from .loader import BatchLoader, AsyncBatchLoader
+from .codec import (
+    JsonCodec,
+    StdlibCodec,
+    OrjsonCodec,
+    MsgspecCodec,
+    InterningCodec,
+)
+from .replay import (
+    RecordingTransport,
+    AsyncRecordingTransport,
+    ReplayTransport,
+    AsyncReplayTransport,
+)
 
+from .schema import Schema, SchemaRegistry, AsyncSchemaRegistry
+from .queries import QueryStore
 
-__all__ = ["Client", "AsyncClient"]
+
+__all__ = [
+    "Client",
+    "AsyncClient",
+    "AdaptivePageSize",
+    "Checkpoint",
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+    "RedisCache",
+    "RetryPolicy",
+    "RateLimiter",
+    "TokenBucket",
+    "FileTokenBucket",
+    "BatchLoader",
+    "AsyncBatchLoader",
+    "JsonCodec",
+    "StdlibCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "InterningCodec",
+    "RecordingTransport",
+    "AsyncRecordingTransport",
+    "ReplayTransport",
+    "AsyncReplayTransport",
+    "Schema",
+    "SchemaRegistry",
+    "AsyncSchemaRegistry",
+    "QueryStore",
+]
@@ -1,27 +1,72 @@
 from typing import (
     TYPE_CHECKING,
     AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Iterable,
     Any,
     Optional,
     cast,
 )
 from types import TracebackType
-from asyncio import sleep
+from asyncio import (
+    sleep,
+    create_task,
+    gather,
+    wait,
+    FIRST_COMPLETED,
+    Queue,
+    Semaphore,
+    Task,
+    shield,
+)
+from collections import deque
+from time import perf_counter
+from itertools import islice
 
 from httpx import (
     AsyncClient as _AsyncClient,
+    AsyncBaseTransport,
+    Limits,
+    Request,
+    Response,
+    TransportError,
+    TimeoutException,
     USE_CLIENT_DEFAULT,
 )
 
-from .base import BaseClient, DatoApiError, DEFAULT_MAX_RETRIES, DEFAULT_RETRY_DELAY
+from .base import (
+    BaseClient,
+    DatoApiError,
+    JsonListDecoder,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_DELAY,
+    DEFAULT_KEYSET_PAGE_SIZE,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_IDS_CHUNK_SIZE,
+    DEFAULT_RETRY_POLICY,
+    MISSING,
+)
+from .checkpoint import Checkpoint
+from .adaptive import AdaptivePageSize
+from .retry import RetryPolicy, IDEMPOTENT_EXTENSION, retry_timeouts
+from .ratelimit import RateLimiter
+from .codec import JsonCodec
+from .. import compact
+from .loader import AsyncBatchLoader
+from .cache import CacheBackend, cache_key
+from .queries import QueryStore
 
 if TYPE_CHECKING:
+    from httpx._types import TimeoutTypes
+
     from ..types.record import Record
     from ..types.model import Model
     from ..types.job import JobResult
     from ..types.upload import Upload, UploadPermission, UploadTag, UploadCollection
     from ..types.job import Job
-    from .base import GetPageAsync
+    from .base import GetPageAsync, GetKeysetPageAsync, StreamPageAsync
 
 
 __all__ = ["AsyncClient"]
@@ -30,10 +75,43 @@ __all__ = ["AsyncClient"]
 class AsyncClient(BaseClient):
     _client: _AsyncClient
 
-    def __init__(self, token: str | None = None):
-        super().__init__(token)
+    def __init__(
+        self,
+        token: str | None = None,
+        *,
+        timeout: "Optional[TimeoutTypes]" = None,
+        limits: Optional[Limits] = None,
+        http2: bool = False,
+        transport: Optional[AsyncBaseTransport] = None,
+        retry: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        rate_limit: Optional[RateLimiter] = None,
+        coalesce: bool = False,
+        codec: Optional[JsonCodec] = None,
+        compact: bool = False,
+        count_cache: Optional[CacheBackend] = None,
+        http_cache: Optional[CacheBackend] = None,
+        graphql_cache: Optional[CacheBackend] = None,
+        queries: Optional[QueryStore] = None,
+    ):
+        super().__init__(
+            token,
+            retry=retry,
+            rate_limit=rate_limit,
+            coalesce=coalesce,
+            codec=codec,
+            compact=compact,
+            count_cache=count_cache,
+            http_cache=http_cache,
+            graphql_cache=graphql_cache,
+            queries=queries,
+        )
         self._client = _AsyncClient(
-            auth=self._auth, base_url=self.base_url, follow_redirects=False
+            auth=self._auth,
+            base_url=self.base_url,
+            follow_redirects=False,
+            **self._client_options(
+                timeout=timeout, limits=limits, http2=http2, transport=transport
+            ),
         )
 
     async def __aenter__(self):
@@ -48,52 +126,357 @@ class AsyncClient(BaseClient):
     ):
         await self._client.__aexit__(exc_type, exc_value, traceback)
 
+    async def _send(self, request: Request, *, stream: bool = False) -> Response:
+        if (key := self._coalesce_key(request, stream)) is None:
+            return await self._dispatch(request, stream=stream)
+
+        if (task := self._inflight.get(key)) is None:
+            task = self._inflight[key] = create_task(self._dispatch(request))
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # a cancelled waiter must not cancel the request shared with others
+        return await shield(task)
+
+    async def _dispatch(self, request: Request, *, stream: bool = False) -> Response:
+        attempt = 0
+        while True:
+            if delay := self._rate_limit_delay():
+                await sleep(delay)
+            try:
+                response = await self._client.send(request, stream=stream)
+            except TransportError as err:
+                delay = self._retry_delay(attempt, request, error=err)
+                if delay is None:
+                    raise
+            else:
+                if stream and not response.is_success:
+                    await response.aread()
+                delay = self._retry_delay(attempt, request, response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            await sleep(delay)
+            attempt += 1
+
+    async def _get_cached(
+        self, url: str, handle, *, params=None, timeout=None
+    ) -> Any:
+        key, entry, headers = self._revalidation(url, params)
+        response = await self._request(
+            "GET",
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout or USE_CLIENT_DEFAULT,
+        )
+        return self._revalidated(key, entry, response, handle)
+
+    async def _request(self, method: str, url: str, **kwargs) -> Response:
+        return await self._send(self._client.build_request(method, url, **kwargs))
+
     @staticmethod
     async def _iter_paginated[T](
-        func: "GetPageAsync[T]", size: int | None = None, /
+        func: "GetPageAsync[T]",
+        size: int | None = None,
+        /,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        prefetch: int | None = None,
+        stream_func: "StreamPageAsync[T] | None" = None,
+        start: int = 0,
+        adaptive: AdaptivePageSize | None = None,
     ) -> AsyncGenerator[T, None]:
+        offset: int = start
+        total: int = offset + 1
+        workers = max(concurrency or 1, 1)
+        depth = max(prefetch or 0, workers)
+
+        if stream_func is not None:
+            if prefetch or workers > 1:
+                raise ValueError("Cannot use stream with concurrency or prefetch")
+            while offset < total:
+                decoder = JsonListDecoder()
+                async for item in stream_func(decoder, offset, limit=size):
+                    yield item
+                offset += decoder.count
+                total = decoder.total_count
+            return
+
+        if adaptive is not None:
+            if prefetch or workers > 1:
+                raise ValueError("Cannot use adaptive with concurrency or prefetch")
+            while offset < total:
+                started = perf_counter()
+                # a timeout shrinks the page instead of retrying the same size
+                token = retry_timeouts.set(adaptive.size <= adaptive.minimum)
+                try:
+                    items, total = await func(limit=adaptive.size, offset=offset)
+                except TimeoutException:
+                    if not adaptive.shrink():
+                        raise
+                    continue
+                finally:
+                    retry_timeouts.reset(token)
+                adaptive.update(
+                    perf_counter() - started,
+                    len(items),
+                    last=offset + len(items) >= total,
+                )
+                offset += len(items)
+
+                for item in items:
+                    yield item
+            return
+
+        if not prefetch and workers == 1:
+            while offset < total:
+                items, total = await func(limit=size, offset=offset)
+                offset += len(items)
+
+                for item in items:
+                    yield item
+            return
+
+        items, total = await func(limit=size, offset=offset)
+        if not items:
+            return
+
+        # the server may cap the page size, step by what it actually returned
+        stride = len(items)
+        offsets = iter(range(offset + stride, total, stride))
+        limiter = Semaphore(workers)
+
+        async def fetch(offset: int):
+            async with limiter:
+                page, count = await func(limit=stride, offset=offset)
+                # a short page before the end would leave a gap, fill it in place
+                while 0 < len(page) < stride and offset + len(page) < count:
+                    more, count = await func(
+                        limit=stride - len(page), offset=offset + len(page)
+                    )
+                    if not more:
+                        break
+                    page = page + more
+                return page, count
+
+        def schedule(count: int):
+            return [create_task(fetch(o)) for o in islice(offsets, count)]
+
+        if ordered:
+            window: deque[Task] = deque(schedule(depth))
+            try:
+                for item in items:
+                    yield item
+                while window:
+                    items, _ = await window.popleft()
+                    window.extend(schedule(1))
+                    for item in items:
+                        yield item
+            finally:
+                for task in window:
+                    task.cancel()
+        else:
+            pending: set[Task] = set(schedule(depth))
+            try:
+                for item in items:
+                    yield item
+                while pending:
+                    done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+                    pending.update(schedule(len(done)))
+                    for task in done:
+                        items, _ = task.result()
+                        for item in items:
+                            yield item
+            finally:
+                for task in pending:
+                    task.cancel()
+
+    @classmethod
+    async def _iter_keyset[T](
+        cls,
+        func: "GetKeysetPageAsync[T]",
+        key: str,
+        size: int,
+        /,
+        value: Any = None,
+        ties: Iterable[str] = (),
+    ) -> AsyncGenerator[T, None]:
+        seen: set[str] = set(ties)
         offset: int = 0
-        total: int = 1
-        while offset < total:
-            items, total = await func(limit=size, offset=offset)
-            offset += len(items)
 
+        while True:
+            items, _ = await func(value, offset, limit=size)
+            fresh = 0
             for item in items:
+                if (current := cls._keyset_value(item, key)) != value:
+                    value, seen = current, set()
+                elif item["id"] in seen:
+                    continue
+                seen.add(item["id"])
+                fresh += 1
+                yield item
+            if len(items) < size:
+                return
+            # a full page of already seen ties, step over them
+            offset = 0 if fresh else offset + len(items)
+
+    @classmethod
+    async def _iter_checkpointed[T](
+        cls, items: AsyncIterable[T], checkpoint: Checkpoint, /
+    ) -> AsyncGenerator[T, None]:
+        key = checkpoint.keyset
+        async for item in items:
+            yield item
+            checkpoint.advance(
+                item["id"], cls._keyset_value(item, key) if key else None
+            )
+
+    @staticmethod
+    async def _iter_merged[T](
+        iterables: list[AsyncIterable[T]], workers: int, buffer: int = 1000, /
+    ) -> AsyncGenerator[T, None]:
+        queue: Queue[tuple[Any, Exception | None]] = Queue(buffer)
+        limiter = Semaphore(max(workers, 1))
+        done = object()
+
+        async def drain(items: AsyncIterable[T]):
+            async with limiter:
+                try:
+                    async for item in items:
+                        await queue.put((item, None))
+                except Exception as err:
+                    await queue.put((done, err))
+                else:
+                    await queue.put((done, None))
+
+        tasks = [create_task(drain(items)) for items in iterables]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item, err = await queue.get()
+                if item is not done:
+                    yield item
+                elif err is not None:
+                    raise err
+                else:
+                    remaining -= 1
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch_chunked[T](
+        self,
+        func: "Callable[[list[str]], Awaitable[tuple[list[T], int]]]",
+        ids: Iterable[str],
+        chunk_size: int | None,
+        concurrency: int | None,
+        ordered: bool,
+    ) -> list[T]:
+        ids = list(ids)
+        chunks = self._chunk_ids(ids, chunk_size or DEFAULT_IDS_CHUNK_SIZE)
+        limiter = Semaphore(concurrency or DEFAULT_CONCURRENCY)
+
+        async def fetch(chunk: list[str]):
+            async with limiter:
+                items, _ = await func(chunk)
+                return items
+
+        pages = await gather(*map(fetch, chunks))
+        items = [item for page in pages for item in page]
+        return self._order_by_ids(items, ids) if ordered else items
+
+    async def _count(
+        self, url: str, params: dict[str, Any], cache_ttl=None, timeout=None
+    ) -> int:
+        key = self._cache_key(self.base_url, cache_key(url, params))
+        if cache_ttl and (total := self._count_cache.get(key)) is not None:
+            return total
+
+        response = await self._request(
+            "GET",
+            url,
+            params=params,
+            headers=self._api_headers,
+            timeout=timeout or USE_CLIENT_DEFAULT,
+        )
+        _, total = self._handle_list_response(response)
+        if cache_ttl:
+            self._count_cache.set(key, total, ttl=cache_ttl)
+        return total
+
+    def _loader(self, name: str, kwargs, fetch) -> AsyncBatchLoader:
+        key = self._loader_key(name, kwargs)
+        if (loader := self._loaders.get(key)) is None:
+            loader = self._loaders.setdefault(key, AsyncBatchLoader(fetch))
+        return loader
+
+    async def _stream_list(
+        self,
+        decoder: JsonListDecoder,
+        url: str,
+        params: dict[str, Any],
+        timeout=None,
+        model: Any = None,
+    ) -> AsyncGenerator[Any, None]:
+        response = await self._send(
+            self._client.build_request(
+                "GET",
+                url,
+                params=params,
+                headers=self._api_headers,
+                timeout=timeout or USE_CLIENT_DEFAULT,
+            ),
+            stream=True,
+        )
+        try:
+            if not response.is_success:
+                self._handle_response(response)
+            async for chunk in response.aiter_bytes():
+                for item in self._stream_items(decoder.feed(chunk), model):
+                    yield item
+            for item in self._stream_items(decoder.close(), model):
                 yield item
+        finally:
+            await response.aclose()
 
     async def execute(self, query, variables, **kwargs) -> "dict[str, Any] | None":
-        response = await self._client.request(
+        key = self._graphql_key(query, variables, kwargs)
+        if (data := self._graphql_lookup(key)) is not MISSING:
+            return data
+        response = await self._request(
             "POST",
             self.graphql_url,
             headers=self._graphql_headers(
                 environment=kwargs.get("environment"),
                 include_drafts=kwargs.get("include_drafts", False),
                 exclude_invalid=kwargs.get("exclude_invalid"),
+                cache_tags=key is not None,
             ),
-            json=self._graphql_payload(query, variables),
+            content=self._encode(self._graphql_payload(query, variables)),
             timeout=kwargs.get("timeout") or USE_CLIENT_DEFAULT,
+            extensions={IDEMPOTENT_EXTENSION: True},
         )
-        return self._handle_graphql_response(response)
+        data = self._handle_graphql_response(response)
+        self._graphql_store(key, response, data)
+        return data
 
     async def execute_from_file(
         self, path, variables, **kwargs
     ) -> dict[str, Any] | None:
-        with open(path, "r") as fp:
-            return await self.execute(fp.read(), variables, **kwargs)
+        return await self.execute(self._queries.get(path), variables, **kwargs)
 
     async def list_fields(self, id, *, timeout=None) -> list:
-        response = await self._client.request(
-            "GET",
+        return await self._get_cached(
             f"item-types/{id}/fields",
-            headers=self._api_headers,
-            timeout=timeout or USE_CLIENT_DEFAULT,
+            lambda response: self._handle_data_response(
+                response, list[compact.Field]
+            ),
+            timeout=timeout,
         )
-        return self._handle_data_response(response)
 
     async def get_job_result(
         self, id, *, timeout=None
     ) -> tuple[int, Optional["Model"]]:
-        response = await self._client.request(
+        response = await self._request(
             "GET",
             f"job-results/{id}",
             headers=self._api_headers,
@@ -120,57 +503,148 @@ class AsyncClient(BaseClient):
         raise RuntimeError("Max retries exceeded")
 
     async def list_models(self, *, timeout=None) -> list["Model"]:
-        response = await self._client.request(
-            "GET",
+        return await self._get_cached(
             "item-types",
-            headers=self._api_headers,
-            timeout=timeout or USE_CLIENT_DEFAULT,
+            lambda response: self._handle_data_response(
+                response, list[compact.Model]
+            ),
+            timeout=timeout,
         )
-        return self._handle_data_response(response)
 
     async def list_records(self, **kwargs) -> "tuple[list[Record], int]":
-        params = self._records_params(
-            nested=kwargs.get("nested", False),
-            locale=kwargs.get("locale"),
-            order_by=kwargs.get("order_by"),
-            version=kwargs.get("version"),
-        )
-        self._page_params(
-            params, limit=kwargs.get("limit"), offset=kwargs.get("offset")
-        )
-        self._filter_params(
-            params,
-            ids=kwargs.get("ids"),
-            types=kwargs.get("types"),
-            query=kwargs.get("query"),
-            fields=kwargs.get("fields"),
-            only_valid=kwargs.get("only_valid", False),
-        )
+        params = self._list_records_params(kwargs)
 
-        response = await self._client.request(
+        response = await self._request(
             "GET",
             "items",
             params=params,
             headers=self._api_headers,
             timeout=kwargs.get("timeout") or USE_CLIENT_DEFAULT,
         )
-        return self._handle_list_response(response)
+        return self._handle_list_response(response, compact.Record)
 
-    def iter_records(self, page_size=None, **kwargs) -> AsyncGenerator["Record", None]:
-        return self._iter_paginated(
-            lambda offset, limit: self.list_records(
-                **kwargs, offset=offset, limit=limit
-            ),
-            page_size,
+    def iter_records(
+        self,
+        page_size=None,
+        *,
+        concurrency=None,
+        ordered=True,
+        prefetch=None,
+        stream=False,
+        keyset=None,
+        checkpoint=None,
+        adaptive=False,
+        **kwargs,
+    ) -> AsyncGenerator["Record", None]:
+        if (types := self._split_types(kwargs, keyset)) is not None:
+            if checkpoint is not None:
+                raise ValueError(
+                    "Cannot use checkpoint with multiple types and fields filters"
+                    " or keyset pagination"
+                )
+            # the model types share the concurrency instead of multiplying it
+            workers = min(len(types), concurrency or DEFAULT_CONCURRENCY)
+            return self._iter_merged(
+                [
+                    self.iter_records(
+                        page_size,
+                        concurrency=concurrency and max(concurrency // workers, 1),
+                        ordered=ordered,
+                        prefetch=prefetch,
+                        stream=stream,
+                        keyset=keyset,
+                        adaptive=adaptive,
+                        **{**kwargs, "types": [type]},
+                    )
+                    for type in types
+                ],
+                workers,
+            )
+        if checkpoint is not None:
+            if not ordered:
+                raise ValueError("Cannot use checkpoint with unordered pagination")
+            page_size, keyset, kwargs = checkpoint.resume(page_size, keyset, kwargs)
+        if keyset is not None:
+            if concurrency or prefetch or stream or adaptive:
+                raise ValueError(
+                    "Cannot use keyset with concurrency, prefetch, stream or adaptive"
+                )
+            items = self._iter_keyset(
+                lambda value, offset, limit: self.list_records(
+                    **self._keyset_params(kwargs, keyset, value),
+                    limit=limit,
+                    offset=offset,
+                ),
+                keyset,
+                page_size or DEFAULT_KEYSET_PAGE_SIZE,
+                value=checkpoint.value if checkpoint else None,
+                ties=checkpoint.seen if checkpoint else (),
+            )
+        else:
+            items = self._iter_paginated(
+                lambda offset, limit: self.list_records(
+                    **kwargs, offset=offset, limit=limit
+                ),
+                page_size,
+                concurrency=concurrency,
+                ordered=ordered,
+                prefetch=prefetch,
+                stream_func=(
+                    lambda decoder, offset, limit: self._stream_list(
+                        decoder,
+                        "items",
+                        self._list_records_params(
+                            {**kwargs, "limit": limit, "offset": offset}
+                        ),
+                        timeout=kwargs.get("timeout"),
+                        model=compact.Record,
+                    )
+                )
+                if stream
+                else None,
+                start=checkpoint.offset if checkpoint else 0,
+                adaptive=self._adaptive_page_size(adaptive, page_size),
+            )
+        return (
+            items if checkpoint is None else self._iter_checkpointed(items, checkpoint)
+        )
+
+    async def fetch_records(
+        self, ids, *, chunk_size=None, concurrency=None, ordered=True, **kwargs
+    ) -> "list[Record]":
+        return await self._fetch_chunked(
+            lambda chunk: self.list_records(**kwargs, ids=chunk, limit=len(chunk)),
+            ids,
+            chunk_size,
+            concurrency,
+            ordered,
+        )
+
+    async def count_records(self, *, cache_ttl=None, **kwargs) -> int:
+        return await self._count(
+            "items",
+            self._count_params(self._list_records_params(kwargs)),
+            cache_ttl=cache_ttl,
+            timeout=kwargs.get("timeout"),
         )
 
+    async def load_record(self, id: str, **kwargs) -> "Record":
+        return await self._loader(
+            "records",
+            kwargs,
+            lambda ids: self.fetch_records(ids, ordered=False, **kwargs),
+        ).load(id)
+
     async def request_upload_permission(
         self, filename, timeout=None
     ) -> "UploadPermission":
-        response = await self._client.post(
+        response = await self._request(
+            "POST",
             "upload-requests",
             headers=self._upload_headers,
-            json=self._api_params("upload_request", filename=filename.lower()),
+            content=self._encode(
+                self._api_params("upload_request", filename=filename.lower())
+            ),
             timeout=timeout or USE_CLIENT_DEFAULT,
         )
         result: "UploadPermission" = self._handle_data_response(response)
@@ -194,9 +668,10 @@ class AsyncClient(BaseClient):
         if relationships:
             payload["data"]["relationships"] = relationships
 
-        response = await self._client.post(
+        response = await self._request(
+            "POST",
             "uploads",
-            json=payload,
+            content=self._encode(payload),
             headers=self._upload_headers,
             timeout=kwargs.get("timeout") or USE_CLIENT_DEFAULT,
         )
@@ -241,13 +716,11 @@ class AsyncClient(BaseClient):
         )
 
     async def get_upload(self, id, timeout=None) -> "Upload":
-        response = await self._client.request(
-            "GET",
+        return await self._get_cached(
             f"uploads/{id}",
-            headers=self._api_headers,
-            timeout=timeout or USE_CLIENT_DEFAULT,
+            lambda response: self._handle_data_response(response, compact.Upload),
+            timeout=timeout,
         )
-        return self._handle_data_response(response)
 
     async def update_upload(self, id, **kwargs) -> "Job":
         params = {}
@@ -270,17 +743,17 @@ class AsyncClient(BaseClient):
         if relationships:
             params["relationships"] = relationships
 
-        response = await self._client.request(
+        response = await self._request(
             "PUT",
             f"uploads/{id}",
             headers=self._upload_headers,
-            json=self._api_update(id, "upload", **params),
+            content=self._encode(self._api_update(id, "upload", **params)),
             timeout=kwargs.get("timeout") or USE_CLIENT_DEFAULT,
         )
         return self._handle_data_response(response)
 
     async def delete_upload(self, id, timeout=None) -> "Upload":
-        response = await self._client.request(
+        response = await self._request(
             "DELETE",
             f"uploads/{id}",
             headers=self._api_headers,
@@ -289,34 +762,84 @@ class AsyncClient(BaseClient):
         return self._handle_data_response(response)
 
     async def list_uploads(self, **kwargs) -> "tuple[list[Upload], int]":
-        params = self._items_params(
-            locale=kwargs.get("locale"), order_by=kwargs.get("order_by")
-        )
-        self._page_params(
-            params, limit=kwargs.get("limit"), offset=kwargs.get("offset")
-        )
-        self._filter_params(
-            params,
-            ids=kwargs.get("ids"),
-            query=kwargs.get("query"),
-            fields=kwargs.get("fields"),
-        )
+        params = self._list_uploads_params(kwargs)
 
-        response = await self._client.request(
+        response = await self._request(
             "GET", "uploads", params=params, headers=self._api_headers
         )
-        return self._handle_list_response(response)
+        return self._handle_list_response(response, compact.Upload)
 
-    def iter_uploads(self, page_size=None, **kwargs) -> "AsyncGenerator[Upload, None]":
-        return self._iter_paginated(
+    def iter_uploads(
+        self,
+        page_size=None,
+        *,
+        concurrency=None,
+        ordered=True,
+        prefetch=None,
+        stream=False,
+        checkpoint=None,
+        adaptive=False,
+        **kwargs,
+    ) -> "AsyncGenerator[Upload, None]":
+        if checkpoint is not None:
+            if not ordered:
+                raise ValueError("Cannot use checkpoint with unordered pagination")
+            page_size, _, kwargs = checkpoint.resume(page_size, None, kwargs)
+        items = self._iter_paginated(
             lambda offset, limit: self.list_uploads(
                 **kwargs, limit=limit, offset=offset
             ),
             page_size,
+            concurrency=concurrency,
+            ordered=ordered,
+            prefetch=prefetch,
+            stream_func=(
+                lambda decoder, offset, limit: self._stream_list(
+                    decoder,
+                    "uploads",
+                    self._list_uploads_params(
+                        {**kwargs, "limit": limit, "offset": offset}
+                    ),
+                    model=compact.Upload,
+                )
+            )
+            if stream
+            else None,
+            start=checkpoint.offset if checkpoint else 0,
+            adaptive=self._adaptive_page_size(adaptive, page_size),
         )
+        return (
+            items if checkpoint is None else self._iter_checkpointed(items, checkpoint)
+        )
+
+    async def fetch_uploads(
+        self, ids, *, chunk_size=None, concurrency=None, ordered=True, **kwargs
+    ) -> "list[Upload]":
+        return await self._fetch_chunked(
+            lambda chunk: self.list_uploads(**kwargs, ids=chunk, limit=len(chunk)),
+            ids,
+            chunk_size,
+            concurrency,
+            ordered,
+        )
+
+    async def count_uploads(self, *, cache_ttl=None, **kwargs) -> int:
+        return await self._count(
+            "uploads",
+            self._count_params(self._list_uploads_params(kwargs)),
+            cache_ttl=cache_ttl,
+            timeout=kwargs.get("timeout"),
+        )
+
+    async def load_upload(self, id: str, **kwargs) -> "Upload":
+        return await self._loader(
+            "uploads",
+            kwargs,
+            lambda ids: self.fetch_uploads(ids, ordered=False, **kwargs),
+        ).load(id)
 
     async def get_referenced_records_by_upload(self, id, **kwargs) -> list["Record"]:
-        response = await self._client.request(
+        response = await self._request(
             "GET",
             f"uploads/{id}/references",
             headers=self._api_headers,
@@ -327,31 +850,72 @@ class AsyncClient(BaseClient):
         return self._handle_data_response(response)
 
     async def create_tag(self, **kwargs) -> str:
-        response = await self._client.request(
+        response = await self._request(
             "POST",
             "upload-tags",
             headers=self._upload_headers,
-            json=self._api_params("upload_tag", name=kwargs["name"]),
+            content=self._encode(
+                self._api_params("upload_tag", name=kwargs["name"])
+            ),
         )
         return self._handle_data_response(response)
 
     async def list_tags(self, **kwargs) -> "tuple[list[UploadTag], int]":
-        self._page_params(
-            params := {}, offset=kwargs.get("offset"), limit=kwargs.get("limit")
-        )
-        self._filter_params(params, query=kwargs.get("query"))
-        response = await self._client.request(
-            "GET",
+        params = self._list_tags_params(kwargs)
+        return await self._get_cached(
             self._tags_endpoint(kwargs.get("tag", "manual")),
-            headers=self._api_headers,
+            lambda response: self._handle_list_response(response, compact.UploadTag),
             params=params,
+            timeout=kwargs.get("timeout"),
         )
-        return self._handle_list_response(response)
 
-    def iter_tags(self, page_size, **kwargs) -> "AsyncGenerator[UploadTag, None]":
-        return self._iter_paginated(
+    def iter_tags(
+        self,
+        page_size=None,
+        *,
+        concurrency=None,
+        ordered=True,
+        prefetch=None,
+        stream=False,
+        checkpoint=None,
+        adaptive=False,
+        **kwargs,
+    ) -> "AsyncGenerator[UploadTag, None]":
+        if checkpoint is not None:
+            if not ordered:
+                raise ValueError("Cannot use checkpoint with unordered pagination")
+            page_size, _, kwargs = checkpoint.resume(page_size, None, kwargs)
+        items = self._iter_paginated(
             lambda offset, limit: self.list_tags(**kwargs, offset=offset, limit=limit),
             page_size,
+            concurrency=concurrency,
+            ordered=ordered,
+            prefetch=prefetch,
+            stream_func=(
+                lambda decoder, offset, limit: self._stream_list(
+                    decoder,
+                    self._tags_endpoint(kwargs.get("tag", "manual")),
+                    self._list_tags_params(
+                        {**kwargs, "limit": limit, "offset": offset}
+                    ),
+                    model=compact.UploadTag,
+                )
+            )
+            if stream
+            else None,
+            start=checkpoint.offset if checkpoint else 0,
+            adaptive=self._adaptive_page_size(adaptive, page_size),
+        )
+        return (
+            items if checkpoint is None else self._iter_checkpointed(items, checkpoint)
+        )
+
+    async def count_tags(self, *, cache_ttl=None, **kwargs) -> int:
+        return await self._count(
+            self._tags_endpoint(kwargs.get("tag", "manual")),
+            self._count_params(self._list_tags_params(kwargs)),
+            cache_ttl=cache_ttl,
+            timeout=kwargs.get("timeout"),
         )
 
     async def list_upload_collections(self, **kwargs) -> "list[UploadCollection]":
@@ -364,11 +928,11 @@ class AsyncClient(BaseClient):
             ids=kwargs.get("ids"),
         )
 
-        response = await self._client.request(
-            "GET",
+        return await self._get_cached(
             "upload-collections",
+            lambda response: self._handle_data_response(
+                response, list[compact.UploadCollection]
+            ),
             params=params,
-            headers=self._api_headers,
-            timeout=kwargs.get("timeout") or USE_CLIENT_DEFAULT,
+            timeout=kwargs.get("timeout"),
         )
-        return self._handle_data_response(response)
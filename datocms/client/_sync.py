@@ -3,24 +3,61 @@ from typing import (
     Iterable,
     Generator,
     Any,
+    Callable,
     Optional,
     cast,
 )
 from types import TracebackType
-from time import sleep
-
-from httpx import Client as _Client, USE_CLIENT_DEFAULT
+from time import sleep, perf_counter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from queue import Queue, Full
+from threading import Event, Lock
+from itertools import islice
+
+from httpx import (
+    Client as _Client,
+    BaseTransport,
+    Limits,
+    Request,
+    Response,
+    TransportError,
+    TimeoutException,
+    USE_CLIENT_DEFAULT,
+)
 
-from .base import BaseClient, DatoApiError, DEFAULT_MAX_RETRIES, DEFAULT_RETRY_DELAY
+from .base import (
+    BaseClient,
+    DatoApiError,
+    JsonListDecoder,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_DELAY,
+    DEFAULT_KEYSET_PAGE_SIZE,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_IDS_CHUNK_SIZE,
+    DEFAULT_RETRY_POLICY,
+    MISSING,
+)
+from .checkpoint import Checkpoint
+from .adaptive import AdaptivePageSize
+from .retry import RetryPolicy, IDEMPOTENT_EXTENSION, retry_timeouts
+from .ratelimit import RateLimiter
+from .codec import JsonCodec
+from .. import compact
+from .loader import BatchLoader
+from .cache import CacheBackend, cache_key
+from .queries import QueryStore
 
 if TYPE_CHECKING:
+    from httpx._types import TimeoutTypes
+
     from ..types.record import Record
     from ..types.model import Model
     from ..types.job import JobResult
     from ..types.upload import Upload, UploadPermission, UploadTag, UploadCollection
     from ..types.job import Job
 
-    from .base import GetPage
+    from .base import GetPage, GetKeysetPage, StreamPage
 
 
 __all__ = ["Client"]
@@ -29,10 +66,44 @@ __all__ = ["Client"]
 class Client(BaseClient):
     _client: _Client
 
-    def __init__(self, token: str | None = None):
-        super().__init__(token)
+    def __init__(
+        self,
+        token: str | None = None,
+        *,
+        timeout: "Optional[TimeoutTypes]" = None,
+        limits: Optional[Limits] = None,
+        http2: bool = False,
+        transport: Optional[BaseTransport] = None,
+        retry: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        rate_limit: Optional[RateLimiter] = None,
+        coalesce: bool = False,
+        codec: Optional[JsonCodec] = None,
+        compact: bool = False,
+        count_cache: Optional[CacheBackend] = None,
+        http_cache: Optional[CacheBackend] = None,
+        graphql_cache: Optional[CacheBackend] = None,
+        queries: Optional[QueryStore] = None,
+    ):
+        super().__init__(
+            token,
+            retry=retry,
+            rate_limit=rate_limit,
+            coalesce=coalesce,
+            codec=codec,
+            compact=compact,
+            count_cache=count_cache,
+            http_cache=http_cache,
+            graphql_cache=graphql_cache,
+            queries=queries,
+        )
+        self._inflight_lock = Lock()
         self._client = _Client(
-            auth=self._auth, base_url=self.base_url, follow_redirects=False
+            auth=self._auth,
+            base_url=self.base_url,
+            follow_redirects=False,
+            **self._client_options(
+                timeout=timeout, limits=limits, http2=http2, transport=transport
+            ),
         )
 
     def __enter__(self):
@@ -47,47 +118,360 @@ class Client(BaseClient):
     ):
         self._client.__exit__(exc_type, exc_value, traceback)
 
+    def _send(self, request: Request, *, stream: bool = False) -> Response:
+        if (key := self._coalesce_key(request, stream)) is None:
+            return self._dispatch(request, stream=stream)
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if leader := future is None:
+                future = self._inflight[key] = Future()
+        if leader:
+            try:
+                future.set_result(self._dispatch(request))
+            except BaseException as err:
+                # followers must not wait forever on an interrupted leader
+                future.set_exception(err)
+                raise
+            finally:
+                with self._inflight_lock:
+                    self._inflight.pop(key, None)
+        return future.result()
+
+    def _dispatch(self, request: Request, *, stream: bool = False) -> Response:
+        attempt = 0
+        while True:
+            if delay := self._rate_limit_delay():
+                sleep(delay)
+            try:
+                response = self._client.send(request, stream=stream)
+            except TransportError as err:
+                delay = self._retry_delay(attempt, request, error=err)
+                if delay is None:
+                    raise
+            else:
+                if stream and not response.is_success:
+                    response.read()
+                delay = self._retry_delay(attempt, request, response)
+                if delay is None:
+                    return response
+                response.close()
+            sleep(delay)
+            attempt += 1
+
+    def _get_cached(
+        self, url: str, handle, *, params=None, timeout=None
+    ) -> Any:
+        key, entry, headers = self._revalidation(url, params)
+        response = self._request(
+            "GET",
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout or USE_CLIENT_DEFAULT,
+        )
+        return self._revalidated(key, entry, response, handle)
+
+    def _request(self, method: str, url: str, **kwargs) -> Response:
+        return self._send(self._client.build_request(method, url, **kwargs))
+
     @staticmethod
     def _iter_paginated[T](
-        func: "GetPage[T]", size: int | None = None, /
+        func: "GetPage[T]",
+        size: int | None = None,
+        /,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        prefetch: int | None = None,
+        stream_func: "StreamPage[T] | None" = None,
+        start: int = 0,
+        adaptive: AdaptivePageSize | None = None,
+    ) -> Generator[T, None, None]:
+        offset: int = start
+        total: int = offset + 1
+        workers = max(concurrency or 1, 1)
+        depth = max(prefetch or 0, workers)
+
+        if stream_func is not None:
+            if prefetch or workers > 1:
+                raise ValueError("Cannot use stream with concurrency or prefetch")
+            while offset < total:
+                decoder = JsonListDecoder()
+                yield from stream_func(decoder, offset, limit=size)
+                offset += decoder.count
+                total = decoder.total_count
+            return
+
+        if adaptive is not None:
+            if prefetch or workers > 1:
+                raise ValueError("Cannot use adaptive with concurrency or prefetch")
+            while offset < total:
+                started = perf_counter()
+                # a timeout shrinks the page instead of retrying the same size
+                token = retry_timeouts.set(adaptive.size <= adaptive.minimum)
+                try:
+                    items, total = func(offset, limit=adaptive.size)
+                except TimeoutException:
+                    if not adaptive.shrink():
+                        raise
+                    continue
+                finally:
+                    retry_timeouts.reset(token)
+                adaptive.update(
+                    perf_counter() - started,
+                    len(items),
+                    last=offset + len(items) >= total,
+                )
+                offset += len(items)
+                yield from items
+            return
+
+        if not prefetch and workers == 1:
+            while offset < total:
+                items, total = func(offset, limit=size)
+                offset += len(items)
+                yield from items
+            return
+
+        items, total = func(offset, limit=size)
+        if not items:
+            return
+
+        # the server may cap the page size, step by what it actually returned
+        stride = len(items)
+        offsets = iter(range(offset + stride, total, stride))
+
+        def fetch(offset: int) -> "tuple[list[T], int]":
+            page, count = func(offset, limit=stride)
+            # a short page before the end would leave a gap, fill it in place
+            while 0 < len(page) < stride and offset + len(page) < count:
+                more, count = func(offset + len(page), limit=stride - len(page))
+                if not more:
+                    break
+                page = page + more
+            return page, count
+
+        with ThreadPoolExecutor(workers) as executor:
+
+            def schedule(count: int):
+                return [executor.submit(fetch, o) for o in islice(offsets, count)]
+
+            if ordered:
+                window: deque[Future] = deque(schedule(depth))
+                try:
+                    yield from items
+                    while window:
+                        items, _ = window.popleft().result()
+                        window.extend(schedule(1))
+                        yield from items
+                finally:
+                    for future in window:
+                        future.cancel()
+            else:
+                pending: set[Future] = set(schedule(depth))
+                try:
+                    yield from items
+                    while pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        pending.update(schedule(len(done)))
+                        for future in done:
+                            yield from future.result()[0]
+                finally:
+                    for future in pending:
+                        future.cancel()
+
+    @classmethod
+    def _iter_keyset[T](
+        cls,
+        func: "GetKeysetPage[T]",
+        key: str,
+        size: int,
+        /,
+        value: Any = None,
+        ties: Iterable[str] = (),
     ) -> Generator[T, None, None]:
+        seen: set[str] = set(ties)
         offset: int = 0
-        total: int = 1
 
-        while offset < total:
-            items, total = func(offset, limit=size)
-            offset += len(items)
-            yield from items
+        while True:
+            items, _ = func(value, offset, limit=size)
+            fresh = 0
+            for item in items:
+                if (current := cls._keyset_value(item, key)) != value:
+                    value, seen = current, set()
+                elif item["id"] in seen:
+                    continue
+                seen.add(item["id"])
+                fresh += 1
+                yield item
+            if len(items) < size:
+                return
+            # a full page of already seen ties, step over them
+            offset = 0 if fresh else offset + len(items)
+
+    @classmethod
+    def _iter_checkpointed[T](
+        cls, items: Iterable[T], checkpoint: Checkpoint, /
+    ) -> Generator[T, None, None]:
+        key = checkpoint.keyset
+        for item in items:
+            yield item
+            checkpoint.advance(
+                item["id"], cls._keyset_value(item, key) if key else None
+            )
+
+    @staticmethod
+    def _iter_merged[T](
+        iterables: list[Iterable[T]], workers: int, buffer: int = 1000, /
+    ) -> Generator[T, None, None]:
+        queue: Queue[tuple[Any, Exception | None]] = Queue(buffer)
+        stop = Event()
+        done = object()
+
+        def put(value: tuple[Any, Exception | None]):
+            while not stop.is_set():
+                try:
+                    return queue.put(value, timeout=0.1)
+                except Full:
+                    continue
+
+        def drain(items: Iterable[T]):
+            try:
+                for item in items:
+                    if stop.is_set():
+                        break
+                    put((item, None))
+            except Exception as err:
+                put((done, err))
+            else:
+                put((done, None))
+            finally:
+                if isinstance(items, Generator):
+                    items.close()
+
+        with ThreadPoolExecutor(workers) as executor:
+            futures = [executor.submit(drain, items) for items in iterables]
+            try:
+                remaining = len(iterables)
+                while remaining:
+                    item, err = queue.get()
+                    if item is not done:
+                        yield item
+                    elif err is not None:
+                        raise err
+                    else:
+                        remaining -= 1
+            finally:
+                stop.set()
+                for future in futures:
+                    future.cancel()
+
+    def _fetch_chunked[T](
+        self,
+        func: "Callable[[list[str]], list[T]]",
+        ids: Iterable[str],
+        chunk_size: int | None,
+        concurrency: int | None,
+        ordered: bool,
+    ) -> list[T]:
+        ids = list(ids)
+        chunks = self._chunk_ids(ids, chunk_size or DEFAULT_IDS_CHUNK_SIZE)
+        workers = min(concurrency or DEFAULT_CONCURRENCY, len(chunks))
+        if workers <= 1:
+            pages = list(map(func, chunks))
+        else:
+            with ThreadPoolExecutor(workers) as executor:
+                pages = list(executor.map(func, chunks))
+        items = [item for page in pages for item in page]
+        return self._order_by_ids(items, ids) if ordered else items
+
+    def _count(
+        self, url: str, params: dict[str, Any], cache_ttl=None, timeout=None
+    ) -> int:
+        key = self._cache_key(self.base_url, cache_key(url, params))
+        if cache_ttl and (total := self._count_cache.get(key)) is not None:
+            return total
+
+        response = self._request(
+            "GET",
+            url,
+            params=params,
+            headers=self._api_headers,
+            timeout=timeout or USE_CLIENT_DEFAULT,
+        )
+        _, total = self._handle_list_response(response)
+        if cache_ttl:
+            self._count_cache.set(key, total, ttl=cache_ttl)
+        return total
+
+    def _loader(self, name: str, kwargs, fetch) -> BatchLoader:
+        key = self._loader_key(name, kwargs)
+        if (loader := self._loaders.get(key)) is None:
+            loader = self._loaders.setdefault(key, BatchLoader(fetch))
+        return loader
+
+    def _stream_list(
+        self,
+        decoder: JsonListDecoder,
+        url: str,
+        params: dict[str, Any],
+        timeout=None,
+        model: Any = None,
+    ) -> Generator[Any, None, None]:
+        response = self._send(
+            self._client.build_request(
+                "GET",
+                url,
+                params=params,
+                headers=self._api_headers,
+                timeout=timeout or USE_CLIENT_DEFAULT,
+            ),
+            stream=True,
+        )
+        try:
+            if not response.is_success:
+                self._handle_response(response)
+            for chunk in response.iter_bytes():
+                yield from self._stream_items(decoder.feed(chunk), model)
+            yield from self._stream_items(decoder.close(), model)
+        finally:
+            response.close()
 
     def execute(self, query, variables, **kwargs) -> "dict[str, Any] | None":
-        response = self._client.request(
+        key = self._graphql_key(query, variables, kwargs)
+        if (data := self._graphql_lookup(key)) is not MISSING:
+            return data
+        response = self._request(
             "POST",
             self.graphql_url,
             headers=self._graphql_headers(
                 environment=kwargs.get("environment"),
                 include_drafts=kwargs.get("include_drafts", False),
                 exclude_invalid=kwargs.get("exclude_invalid"),
+                cache_tags=key is not None,
             ),
-            json=self._graphql_payload(query, variables),
+            content=self._encode(self._graphql_payload(query, variables)),
             timeout=kwargs.get("timeout") or USE_CLIENT_DEFAULT,
+            extensions={IDEMPOTENT_EXTENSION: True},
         )
-        return self._handle_graphql_response(response)
+        data = self._handle_graphql_response(response)
+        self._graphql_store(key, response, data)
+        return data
 
     def execute_from_file(self, path, variables, **kwargs) -> "dict[str, Any] | None":
-        with open(path, "r") as fp:
-            return self.execute(fp.read(), variables, **kwargs)
+        return self.execute(self._queries.get(path), variables, **kwargs)
 
     def list_fields(self, id, *, timeout=None) -> list:
-        response = self._client.request(
-            "GET",
+        return self._get_cached(
             f"item-types/{id}/fields",
-            headers=self._api_headers,
-            timeout=timeout or USE_CLIENT_DEFAULT,
+            lambda response: self._handle_data_response(
+                response, list[compact.Field]
+            ),
+            timeout=timeout,
         )
-        return self._handle_data_response(response)
 
     def get_job_result(self, id, *, timeout=None) -> tuple[int, Optional["Model"]]:
-        response = self._client.request(
+        response = self._request(
             "GET",
             f"job-results/{id}",
             headers=self._api_headers,
@@ -113,63 +497,158 @@ class Client(BaseClient):
         raise RuntimeError("Max retries exceeded")
 
     def list_models(self, *, timeout=None) -> list["Model"]:
-        response = self._client.request(
-            "GET",
+        return self._get_cached(
             "item-types",
-            headers=self._api_headers,
-            timeout=timeout or USE_CLIENT_DEFAULT,
+            lambda response: self._handle_data_response(
+                response, list[compact.Model]
+            ),
+            timeout=timeout,
         )
-        return self._handle_data_response(response)
 
     def list_records(self, **kwargs) -> "tuple[list[Record], int]":
-        params = self._records_params(
-            nested=kwargs.get("nested", False),
-            locale=kwargs.get("locale"),
-            order_by=kwargs.get("order_by"),
-            version=kwargs.get("version"),
-        )
-        self._page_params(
-            params, limit=kwargs.get("limit"), offset=kwargs.get("offset")
-        )
-        self._filter_params(
-            params,
-            ids=kwargs.get("ids"),
-            types=kwargs.get("types"),
-            query=kwargs.get("query"),
-            fields=kwargs.get("fields"),
-            only_valid=kwargs.get("only_valid", False),
-        )
+        params = self._list_records_params(kwargs)
 
-        response = self._client.request(
+        response = self._request(
             "GET",
             "items",
             params=params,
             headers=self._api_headers,
             timeout=kwargs.get("timeout") or USE_CLIENT_DEFAULT,
         )
-        return self._handle_list_response(response)
+        return self._handle_list_response(response, compact.Record)
 
     def iter_records(
-        self, page_size: int | None = None, **kwargs
+        self,
+        page_size: int | None = None,
+        *,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        prefetch: int | None = None,
+        stream: bool = False,
+        keyset: str | None = None,
+        checkpoint: Checkpoint | None = None,
+        adaptive: bool | AdaptivePageSize = False,
+        **kwargs,
     ) -> "Generator[Record, None, None]":
-        return self._iter_paginated(
-            lambda offset, limit: self.list_records(
-                limit=limit,
-                offset=offset,
-                **kwargs,
-            ),
-            page_size,
+        if (types := self._split_types(kwargs, keyset)) is not None:
+            if checkpoint is not None:
+                raise ValueError(
+                    "Cannot use checkpoint with multiple types and fields filters"
+                    " or keyset pagination"
+                )
+            # the model types share the concurrency instead of multiplying it
+            workers = min(len(types), concurrency or DEFAULT_CONCURRENCY)
+            return self._iter_merged(
+                [
+                    self.iter_records(
+                        page_size,
+                        concurrency=concurrency and max(concurrency // workers, 1),
+                        ordered=ordered,
+                        prefetch=prefetch,
+                        stream=stream,
+                        keyset=keyset,
+                        adaptive=adaptive,
+                        **{**kwargs, "types": [type]},
+                    )
+                    for type in types
+                ],
+                workers,
+            )
+        if checkpoint is not None:
+            if not ordered:
+                raise ValueError("Cannot use checkpoint with unordered pagination")
+            page_size, keyset, kwargs = checkpoint.resume(page_size, keyset, kwargs)
+        if keyset is not None:
+            if concurrency or prefetch or stream or adaptive:
+                raise ValueError(
+                    "Cannot use keyset with concurrency, prefetch, stream or adaptive"
+                )
+            items = self._iter_keyset(
+                lambda value, offset, limit: self.list_records(
+                    **self._keyset_params(kwargs, keyset, value),
+                    limit=limit,
+                    offset=offset,
+                ),
+                keyset,
+                page_size or DEFAULT_KEYSET_PAGE_SIZE,
+                value=checkpoint.value if checkpoint else None,
+                ties=checkpoint.seen if checkpoint else (),
+            )
+        else:
+            items = self._iter_paginated(
+                lambda offset, limit: self.list_records(
+                    limit=limit,
+                    offset=offset,
+                    **kwargs,
+                ),
+                page_size,
+                concurrency=concurrency,
+                ordered=ordered,
+                prefetch=prefetch,
+                stream_func=(
+                    lambda decoder, offset, limit: self._stream_list(
+                        decoder,
+                        "items",
+                        self._list_records_params(
+                            {**kwargs, "limit": limit, "offset": offset}
+                        ),
+                        timeout=kwargs.get("timeout"),
+                        model=compact.Record,
+                    )
+                )
+                if stream
+                else None,
+                start=checkpoint.offset if checkpoint else 0,
+                adaptive=self._adaptive_page_size(adaptive, page_size),
+            )
+        return (
+            items if checkpoint is None else self._iter_checkpointed(items, checkpoint)
         )
 
+    def fetch_records(
+        self,
+        ids: Iterable[str],
+        *,
+        chunk_size: int | None = None,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        **kwargs,
+    ) -> "list[Record]":
+        return self._fetch_chunked(
+            lambda chunk: self.list_records(ids=chunk, limit=len(chunk), **kwargs)[0],
+            ids,
+            chunk_size,
+            concurrency,
+            ordered,
+        )
+
+    def count_records(self, *, cache_ttl=None, **kwargs) -> int:
+        return self._count(
+            "items",
+            self._count_params(self._list_records_params(kwargs)),
+            cache_ttl=cache_ttl,
+            timeout=kwargs.get("timeout"),
+        )
+
+    def load_record(self, id: str, **kwargs) -> "Record":
+        return self._loader(
+            "records",
+            kwargs,
+            lambda ids: self.fetch_records(ids, ordered=False, **kwargs),
+        ).load(id)
+
     def request_upload_permission(
         self,
         filename,
         timeout=None,
     ) -> "UploadPermission":
-        response = self._client.post(
+        response = self._request(
+            "POST",
             "upload-requests",
             headers=self._upload_headers,
-            json=self._api_params("upload_request", filename=filename.lower()),
+            content=self._encode(
+                self._api_params("upload_request", filename=filename.lower())
+            ),
             timeout=timeout or USE_CLIENT_DEFAULT,
         )
         result: "UploadPermission" = self._handle_data_response(response)
@@ -193,9 +672,10 @@ class Client(BaseClient):
         if relationships:
             payload["data"]["relationships"] = relationships
 
-        response = self._client.post(
+        response = self._request(
+            "POST",
             "uploads",
-            json=payload,
+            content=self._encode(payload),
             headers=self._upload_headers,
             timeout=kwargs.get("timeout") or USE_CLIENT_DEFAULT,
         )
@@ -237,13 +717,11 @@ class Client(BaseClient):
         )
 
     def get_upload(self, id, timeout=None) -> "Upload":
-        response = self._client.request(
-            "GET",
+        return self._get_cached(
             f"uploads/{id}",
-            headers=self._api_headers,
-            timeout=timeout or USE_CLIENT_DEFAULT,
+            lambda response: self._handle_data_response(response, compact.Upload),
+            timeout=timeout,
         )
-        return self._handle_data_response(response)
 
     def update_upload(self, id: str, **kwargs) -> "Job":
         params = {}
@@ -266,17 +744,17 @@ class Client(BaseClient):
         if relationships:
             params["relationships"] = relationships
 
-        response = self._client.request(
+        response = self._request(
             "PUT",
             f"uploads/{id}",
             headers=self._upload_headers,
-            json=self._api_update(id, "upload", **params),
+            content=self._encode(self._api_update(id, "upload", **params)),
             timeout=kwargs.get("timeout") or USE_CLIENT_DEFAULT,
         )
         return self._handle_data_response(response)
 
     def delete_upload(self, id, timeout=None) -> "Upload":
-        response = self._client.request(
+        response = self._request(
             "DELETE",
             f"uploads/{id}",
             headers=self._api_headers,
@@ -285,28 +763,30 @@ class Client(BaseClient):
         return self._handle_data_response(response)
 
     def list_uploads(self, **kwargs) -> "tuple[list[Upload], int]":
-        params = self._items_params(
-            locale=kwargs.get("locale"), order_by=kwargs.get("order_by")
-        )
-        self._page_params(
-            params, limit=kwargs.get("limit"), offset=kwargs.get("offset")
-        )
-        self._filter_params(
-            params,
-            ids=kwargs.get("ids"),
-            query=kwargs.get("query"),
-            fields=kwargs.get("fields"),
-        )
+        params = self._list_uploads_params(kwargs)
 
-        response = self._client.request(
+        response = self._request(
             "GET", "uploads", params=params, headers=self._api_headers
         )
-        return self._handle_list_response(response)
+        return self._handle_list_response(response, compact.Upload)
 
     def iter_uploads(
-        self, page_size: "int | None" = None, **kwargs
+        self,
+        page_size: "int | None" = None,
+        *,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        prefetch: int | None = None,
+        stream: bool = False,
+        checkpoint: Checkpoint | None = None,
+        adaptive: bool | AdaptivePageSize = False,
+        **kwargs,
     ) -> "Generator[Upload, None, None]":
-        return self._iter_paginated(
+        if checkpoint is not None:
+            if not ordered:
+                raise ValueError("Cannot use checkpoint with unordered pagination")
+            page_size, _, kwargs = checkpoint.resume(page_size, None, kwargs)
+        items = self._iter_paginated(
             lambda offset, limit: self.list_uploads(
                 order_by=kwargs.get("order_by"),
                 locale=kwargs.get("locale"),
@@ -317,10 +797,62 @@ class Client(BaseClient):
                 offset=offset,
             ),
             page_size,
+            concurrency=concurrency,
+            ordered=ordered,
+            prefetch=prefetch,
+            stream_func=(
+                lambda decoder, offset, limit: self._stream_list(
+                    decoder,
+                    "uploads",
+                    self._list_uploads_params(
+                        {**kwargs, "limit": limit, "offset": offset}
+                    ),
+                    model=compact.Upload,
+                )
+            )
+            if stream
+            else None,
+            start=checkpoint.offset if checkpoint else 0,
+            adaptive=self._adaptive_page_size(adaptive, page_size),
+        )
+        return (
+            items if checkpoint is None else self._iter_checkpointed(items, checkpoint)
+        )
+
+    def fetch_uploads(
+        self,
+        ids: Iterable[str],
+        *,
+        chunk_size: int | None = None,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        **kwargs,
+    ) -> "list[Upload]":
+        return self._fetch_chunked(
+            lambda chunk: self.list_uploads(ids=chunk, limit=len(chunk), **kwargs)[0],
+            ids,
+            chunk_size,
+            concurrency,
+            ordered,
+        )
+
+    def count_uploads(self, *, cache_ttl=None, **kwargs) -> int:
+        return self._count(
+            "uploads",
+            self._count_params(self._list_uploads_params(kwargs)),
+            cache_ttl=cache_ttl,
+            timeout=kwargs.get("timeout"),
         )
 
+    def load_upload(self, id: str, **kwargs) -> "Upload":
+        return self._loader(
+            "uploads",
+            kwargs,
+            lambda ids: self.fetch_uploads(ids, ordered=False, **kwargs),
+        ).load(id)
+
     def get_referenced_records_by_upload(self, id: str, **kwargs) -> list["Record"]:
-        response = self._client.request(
+        response = self._request(
             "GET",
             f"uploads/{id}/references",
             headers=self._api_headers,
@@ -331,35 +863,72 @@ class Client(BaseClient):
         return self._handle_data_response(response)
 
     def create_tag(self, **kwargs) -> str:
-        response = self._client.request(
+        response = self._request(
             "POST",
             "upload-tags",
             headers=self._upload_headers,
-            json=self._api_params("upload_tag", name=kwargs["name"]),
+            content=self._encode(
+                self._api_params("upload_tag", name=kwargs["name"])
+            ),
         )
         return self._handle_data_response(response)
 
     def list_tags(self, **kwargs) -> "tuple[list[UploadTag], int]":
-        self._page_params(
-            params := {}, offset=kwargs.get("offset"), limit=kwargs.get("limit")
-        )
-        self._filter_params(params, query=kwargs.get("query"))
-        response = self._client.request(
-            "GET",
+        params = self._list_tags_params(kwargs)
+        return self._get_cached(
             self._tags_endpoint(kwargs.get("tag", "manual")),
-            headers=self._api_headers,
+            lambda response: self._handle_list_response(response, compact.UploadTag),
             params=params,
+            timeout=kwargs.get("timeout"),
         )
-        return self._handle_list_response(response)
 
     def iter_tags(
-        self, page_size: "int | None" = None, **kwargs
+        self,
+        page_size: "int | None" = None,
+        *,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        prefetch: int | None = None,
+        stream: bool = False,
+        checkpoint: Checkpoint | None = None,
+        adaptive: bool | AdaptivePageSize = False,
+        **kwargs,
     ) -> "Generator[UploadTag, None, None]":
-        return self._iter_paginated(
-            lambda offset, limit: self.list_tags(
-                tag=kwargs.get("tag", "manual"), limit=limit, offset=offset
-            ),
+        if checkpoint is not None:
+            if not ordered:
+                raise ValueError("Cannot use checkpoint with unordered pagination")
+            page_size, _, kwargs = checkpoint.resume(page_size, None, kwargs)
+        items = self._iter_paginated(
+            lambda offset, limit: self.list_tags(**kwargs, offset=offset, limit=limit),
             page_size,
+            concurrency=concurrency,
+            ordered=ordered,
+            prefetch=prefetch,
+            stream_func=(
+                lambda decoder, offset, limit: self._stream_list(
+                    decoder,
+                    self._tags_endpoint(kwargs.get("tag", "manual")),
+                    self._list_tags_params(
+                        {**kwargs, "limit": limit, "offset": offset}
+                    ),
+                    model=compact.UploadTag,
+                )
+            )
+            if stream
+            else None,
+            start=checkpoint.offset if checkpoint else 0,
+            adaptive=self._adaptive_page_size(adaptive, page_size),
+        )
+        return (
+            items if checkpoint is None else self._iter_checkpointed(items, checkpoint)
+        )
+
+    def count_tags(self, *, cache_ttl=None, **kwargs) -> int:
+        return self._count(
+            self._tags_endpoint(kwargs.get("tag", "manual")),
+            self._count_params(self._list_tags_params(kwargs)),
+            cache_ttl=cache_ttl,
+            timeout=kwargs.get("timeout"),
         )
 
     def list_upload_collections(self, **kwargs) -> "list[UploadCollection]":
@@ -372,11 +941,11 @@ class Client(BaseClient):
             ids=kwargs.get("ids"),
         )
 
-        response = self._client.request(
-            "GET",
+        return self._get_cached(
             "upload-collections",
+            lambda response: self._handle_data_response(
+                response, list[compact.UploadCollection]
+            ),
             params=params,
-            headers=self._api_headers,
-            timeout=kwargs.get("timeout") or USE_CLIENT_DEFAULT,
+            timeout=kwargs.get("timeout"),
         )
-        return self._handle_data_response(response)
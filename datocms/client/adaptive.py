@@ -0,0 +1,55 @@
+__all__ = ["AdaptivePageSize"]
+
+
+class AdaptivePageSize:
+    def __init__(
+        self,
+        size: int = 500,
+        *,
+        target: float = 1.0,
+        minimum: int = 10,
+        maximum: int = 500,
+        cooldown: int = 10,
+    ):
+        if not 0 < minimum <= maximum <= 500:
+            raise ValueError("Page size bounds must be between 1 and 500")
+        self.target = target
+        self.minimum = minimum
+        self.maximum = maximum
+        self.cooldown = cooldown
+        self.size = self._clamp(size)
+        self._ceiling: int | None = None
+        self._wait = cooldown
+        self._pages = 0
+
+    def _clamp(self, size: int) -> int:
+        return max(self.minimum, min(self.maximum, size))
+
+    def update(self, elapsed: float, count: int, last: bool = False):
+        if count < self.size:
+            # a short last page says nothing about the cost of a full one
+            if last:
+                return
+            # any other short page is capped by the server, never ask for more
+            self.maximum = max(self.minimum, count)
+            self.size = self._clamp(count)
+        # damp the step so a single slow response does not collapse the size
+        ratio = max(0.5, min(2.0, self.target / max(elapsed, 1e-3)))
+        size = round(self.size * ratio)
+        # stay well below a size that timed out until the cooldown has passed
+        if self._ceiling is not None and self._pages < self._wait:
+            self._pages += 1
+            size = min(size, self._ceiling * 3 // 4)
+        self.size = self._clamp(size)
+
+    def shrink(self) -> bool:
+        if self.size <= self.minimum:
+            return False
+        if self._ceiling is None or self.size < self._ceiling:
+            self._ceiling = self.size
+        # a timeout right after the cooldown means it was too short
+        if self._pages >= self._wait:
+            self._wait *= 2
+        self._pages = 0
+        self.size = self._clamp(self.size // 2)
+        return True
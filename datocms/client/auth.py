@@ -1,4 +1,5 @@
 from os import environ
+from hashlib import sha256
 from httpx import Auth, Request
 
 
@@ -8,6 +9,7 @@ __all__ = ["DatoAuth"]
 class DatoAuth(Auth):
     def __init__(self, token: str | None = None, /):
         self._token = token or environ["DATOCMS_API_TOKEN"]
+        self.digest = sha256(self._token.encode()).hexdigest()
 
     def auth_flow(self, request: Request):
         request.headers["Authorization"] = f"Bearer {self._token}"
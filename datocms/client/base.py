@@ -11,15 +11,26 @@ from typing import (
     Unpack,
     Union,
     Awaitable,
+    Callable,
     cast,
 )
 from os import PathLike
+from hashlib import sha256
+import json
 from abc import abstractmethod
 
-from httpx import Response
+from httpx import Request, Response, TransportError
 
 from ..errors import DatoApiError, DatoGraphqlError
 from .auth import DatoAuth
+from .stream import JsonListDecoder
+from .cache import CacheBackend, MemoryCache, cache_key
+from .adaptive import AdaptivePageSize
+from .retry import RetryPolicy, IDEMPOTENT_EXTENSION, retry_timeouts
+from .ratelimit import RateLimiter
+from .codec import JsonCodec, InterningCodec, default_codec
+from .queries import QueryStore
+from ..compact import convert, decode_data, decode_list
 
 
 if TYPE_CHECKING:
@@ -39,7 +50,9 @@ if TYPE_CHECKING:
         ListRecordsWithPaginationParams,
         ListUploadsWithPaginationParams,
         ListTagsWithPaginationParams,
-        ListTagsWithPaginationParams,
+        CountRecordsParams,
+        CountUploadsParams,
+        CountTagsParams,
         ListUploadCollectionsParams,
         CreateUploadWithRetryParams,
         GetReferencedRecordsByUploadParams,
@@ -69,6 +82,26 @@ if TYPE_CHECKING:
             self, offset: int, *, limit: int | None
         ) -> tuple[list[T], int]: ...
 
+    class GetKeysetPage[T](Protocol):
+        def __call__(
+            self, value: Any, offset: int, *, limit: int
+        ) -> tuple[list[T], int]: ...
+
+    class GetKeysetPageAsync[T](Protocol):
+        async def __call__(
+            self, value: Any, offset: int, *, limit: int
+        ) -> tuple[list[T], int]: ...
+
+    class StreamPage[T](Protocol):
+        def __call__(
+            self, decoder: JsonListDecoder, offset: int, *, limit: int | None
+        ) -> Iterable[T]: ...
+
+    class StreamPageAsync[T](Protocol):
+        def __call__(
+            self, decoder: JsonListDecoder, offset: int, *, limit: int | None
+        ) -> AsyncIterable[T]: ...
+
     R = TypeVar("R")
     Returnable = Union[R, Awaitable[R]]
 
@@ -78,13 +111,26 @@ __all__ = [
     "BaseClient",
     "DEFAULT_RETRY_DELAY",
     "DEFAULT_MAX_RETRIES",
+    "DEFAULT_KEYSET_PAGE_SIZE",
+    "DEFAULT_CONCURRENCY",
+    "DEFAULT_IDS_CHUNK_SIZE",
+    "DEFAULT_RETRY_POLICY",
+    "RetryPolicy",
     "DatoApiError",
     "DatoGraphqlError",
+    "JsonListDecoder",
 ]
 
 
 DEFAULT_RETRY_DELAY = 1.0
 DEFAULT_MAX_RETRIES = 10
+DEFAULT_KEYSET_PAGE_SIZE = 500
+DEFAULT_CONCURRENCY = 8
+DEFAULT_IDS_CHUNK_SIZE = 100
+MAX_IDS_PARAM_LENGTH = 2000
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+MISSING: Any = object()
 
 
 class BaseClient:
@@ -95,14 +141,84 @@ class BaseClient:
     _upload_headers = {**_api_headers, "Content-Type": "application/vnd.api+json"}
 
     _auth: DatoAuth
-
-    def __init__(self, token: str | None = None):
+    _count_cache: CacheBackend
+    _http_cache: CacheBackend | None
+    _graphql_cache: CacheBackend | None
+    _queries: QueryStore
+    _retry: RetryPolicy | None
+    _rate_limit: RateLimiter | None
+    _coalesce: bool
+    _codec: JsonCodec
+    _compact: bool
+    _inflight: dict[tuple[str, tuple[tuple[str, str], ...]], Any]
+
+    def __init__(
+        self,
+        token: str | None = None,
+        retry: RetryPolicy | None = DEFAULT_RETRY_POLICY,
+        rate_limit: RateLimiter | None = None,
+        coalesce: bool = False,
+        codec: JsonCodec | None = None,
+        compact: bool = False,
+        count_cache: CacheBackend | None = None,
+        http_cache: CacheBackend | None = None,
+        graphql_cache: CacheBackend | None = None,
+        queries: QueryStore | None = None,
+    ):
         self._auth = DatoAuth(token)
+        self._codec = codec or default_codec()
+        self._compact = compact
+        self._count_cache = count_cache if count_cache is not None else MemoryCache()
+        self._http_cache = http_cache
+        self._graphql_cache = graphql_cache
+        self._queries = queries if queries is not None else QueryStore()
+        self._retry = retry
+        self._rate_limit = rate_limit
+        self._coalesce = coalesce
+        self._inflight = {}
+        self._loaders: dict[tuple[str, str], Any] = {}
 
     @staticmethod
-    def _handle_response(response: "Response") -> dict[str, Any]:
+    def _loader_key(name: str, kwargs: Mapping[str, Any]) -> tuple[str, str]:
+        # filters may be lists or dicts and timeouts objects, none of them hashable
+        return name, json.dumps(kwargs, sort_keys=True, default=repr)
+
+    def _coalesce_key(
+        self, request: "Request", stream: bool = False
+    ) -> tuple[str, tuple[tuple[str, str], ...]] | None:
+        if not self._coalesce or stream or request.method != "GET":
+            return None
+        return str(request.url), tuple(request.headers.multi_items())
+
+    def _rate_limit_delay(self) -> float:
+        return 0.0 if self._rate_limit is None else self._rate_limit.reserve()
+
+    def _retry_delay(
+        self,
+        attempt: int,
+        request: Request,
+        response: Response | None = None,
+        error: TransportError | None = None,
+    ) -> float | None:
+        if self._retry is None:
+            return None
+        return self._retry.delay(
+            attempt,
+            request.method,
+            response=response,
+            error=error,
+            idempotent=request.extensions.get(IDEMPOTENT_EXTENSION),
+            timeouts=retry_timeouts.get(),
+        )
+
+    @staticmethod
+    def _client_options(**options: Any) -> dict[str, Any]:
+        # leave unset options to the httpx defaults
+        return {k: v for k, v in options.items() if v is not None and v is not False}
+
+    def _handle_response(self, response: "Response") -> dict[str, Any]:
         result = (
-            response.json()
+            self._codec.loads(response.content)
             if "application/json" in response.headers["Content-Type"]
             else None
         )
@@ -120,9 +236,10 @@ class BaseClient:
             response.raise_for_status()
             raise
 
-    @staticmethod
-    def _handle_graphql_response(response: "Response") -> dict[str, Any] | None:
-        result: "GraphqlResult" = response.raise_for_status().json()
+    def _handle_graphql_response(self, response: "Response") -> dict[str, Any] | None:
+        result: "GraphqlResult" = self._codec.loads(
+            response.raise_for_status().content
+        )
         if (errors := result.get("errors")) is None:
             return result.get("data")
         else:
@@ -135,16 +252,69 @@ class BaseClient:
             else:
                 raise ExceptionGroup("GraphQL errors", errors)
 
-    @classmethod
-    def _handle_data_response(cls, response: "Response") -> Any:
-        return cls._handle_response(response)["data"]
-
-    @classmethod
-    def _handle_list_response(cls, response: "Response") -> tuple[list[Any], int]:
-        return cls._list_result_to_tuple(
-            cast("ArrayResult", cls._handle_response(response))
+    def _handle_data_response(self, response: "Response", model: Any = None) -> Any:
+        if self._compact and model is not None and response.is_success:
+            return decode_data(
+                response.content, model, self._codec.loads, direct=self._direct
+            )
+        return self._handle_response(response)["data"]
+
+    def _handle_list_response(
+        self, response: "Response", model: Any = None
+    ) -> tuple[list[Any], int]:
+        if self._compact and model is not None and response.is_success:
+            return decode_list(
+                response.content, model, self._codec.loads, direct=self._direct
+            )
+        return self._list_result_to_tuple(
+            cast("ArrayResult", self._handle_response(response))
         )
 
+    def _cache_key(self, endpoint: str, key: str, /) -> str:
+        # a shared store may serve several projects and tokens, keep them apart
+        return f"{endpoint}|{self._auth.digest}|{key}"
+
+    def _revalidation(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> tuple[str, tuple[str, Any] | None, dict[str, str]]:
+        key = self._cache_key(self.base_url, cache_key(url, params))
+        if self._compact:
+            # compact and plain results are different objects
+            key += "|compact"
+        if self._http_cache is None or (entry := self._http_cache.get(key)) is None:
+            return key, None, self._api_headers
+        return key, entry, {**self._api_headers, "If-None-Match": entry[0]}
+
+    def _revalidated(
+        self,
+        key: str,
+        entry: tuple[str, Any] | None,
+        response: "Response",
+        handle: Callable[["Response"], Any],
+    ) -> Any:
+        # the cached object is handed out again, callers must not mutate it
+        if entry is not None and response.status_code == 304:
+            return entry[1]
+        value = handle(response)
+        if self._http_cache is not None and (etag := response.headers.get("ETag")):
+            self._http_cache.set(key, (etag, value))
+        return value
+
+    @property
+    def _direct(self) -> bool:
+        # decoding straight into the compact types would bypass the interning
+        return not isinstance(self._codec, InterningCodec)
+
+    def _stream_items(self, items: Iterable[Any], model: Any = None) -> Iterable[Any]:
+        if isinstance(self._codec, InterningCodec):
+            items = map(self._codec.share, items)
+        if self._compact and model is not None:
+            items = (convert(item, model) for item in items)
+        return items
+
+    def _encode(self, obj: Any, /) -> bytes:
+        return self._codec.dumps(obj)
+
     @staticmethod
     def _page_params(
         p: MutableMapping[str, Any],
@@ -179,7 +349,7 @@ class BaseClient:
         if types is not None:
             if ids is None:
                 ftype = p["filter[type]"] = ",".join(types)
-                if ftype.count(",") > 1 and fields is not None:
+                if "," in ftype and fields is not None:
                     raise ValueError(
                         "Cannot use both multiple types and fields filters"
                     )
@@ -201,6 +371,32 @@ class BaseClient:
         if only_valid:
             p["filter[only_valid]"] = "true"
 
+    @staticmethod
+    def _chunk_ids(
+        ids: Iterable[str],
+        size: int = DEFAULT_IDS_CHUNK_SIZE,
+        length: int = MAX_IDS_PARAM_LENGTH,
+    ) -> list[list[str]]:
+        if size <= 0 or size > 500:
+            raise ValueError("Chunk size must be between 1 and 500")
+        chunks: list[list[str]] = []
+        chunk: list[str] = []
+        used = 0
+        for id in dict.fromkeys(ids):
+            if chunk and (len(chunk) >= size or used + len(id) + 1 > length):
+                chunks.append(chunk)
+                chunk, used = [], 0
+            chunk.append(id)
+            used += len(id) + 1
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @staticmethod
+    def _order_by_ids(items: Iterable[Any], ids: Iterable[str]) -> list[Any]:
+        index = {item["id"]: item for item in items}
+        return [index[id] for id in dict.fromkeys(ids) if id in index]
+
     @staticmethod
     def _items_params(locale: str | None = None, order_by: str | None = None):
         p = {}
@@ -235,6 +431,103 @@ class BaseClient:
             p["version"] = version
         return p
 
+    @classmethod
+    def _list_records_params(cls, kwargs: Mapping[str, Any]) -> dict[str, Any]:
+        params = cls._records_params(
+            nested=kwargs.get("nested", False),
+            locale=kwargs.get("locale"),
+            order_by=kwargs.get("order_by"),
+            version=kwargs.get("version"),
+        )
+        cls._page_params(
+            params, limit=kwargs.get("limit"), offset=kwargs.get("offset")
+        )
+        cls._filter_params(
+            params,
+            ids=kwargs.get("ids"),
+            types=kwargs.get("types"),
+            query=kwargs.get("query"),
+            fields=kwargs.get("fields"),
+            only_valid=kwargs.get("only_valid", False),
+        )
+        return params
+
+    @staticmethod
+    def _adaptive_page_size(
+        adaptive: "bool | AdaptivePageSize", page_size: int | None = None
+    ) -> AdaptivePageSize | None:
+        if isinstance(adaptive, AdaptivePageSize):
+            return adaptive
+        return AdaptivePageSize(page_size or 500) if adaptive else None
+
+    @staticmethod
+    def _split_types(
+        kwargs: MutableMapping[str, Any], keyset: str | None = None
+    ) -> list[str] | None:
+        if (types := kwargs.get("types")) is None:
+            return None
+        kwargs["types"] = types = list(types)
+        # fields filters and keyset ordering need one type per request
+        if kwargs.get("fields") is None and keyset is None:
+            return None
+        return types if len(types) > 1 else None
+
+    @staticmethod
+    def _keyset_params(
+        kwargs: Mapping[str, Any], key: str, value: Any = None
+    ) -> dict[str, Any]:
+        if kwargs.get("order_by") is not None:
+            raise ValueError("Cannot use both order_by and keyset pagination")
+        if kwargs.get("ids") is not None:
+            raise ValueError("Cannot use both ids and keyset pagination")
+        # the API only sorts and filters on fields within a single model
+        ftype = ",".join(kwargs.get("types") or ())
+        if not ftype or "," in ftype:
+            raise ValueError("Keyset pagination needs exactly one type")
+        fields = dict(kwargs.get("fields") or {})
+        if value is not None:
+            fields[key] = {**fields.get(key, {}), "gte": value}
+        return {**kwargs, "fields": fields or None, "order_by": f"{key}_ASC"}
+
+    @staticmethod
+    def _keyset_value(item: Mapping[str, Any], key: str, /) -> Any:
+        if key == "id":
+            return item["id"]
+        elif key.startswith("_"):
+            return item["meta"][key[1:]]
+        else:
+            return item["attributes"][key]
+
+    @classmethod
+    def _list_uploads_params(cls, kwargs: Mapping[str, Any]) -> dict[str, Any]:
+        params = cls._items_params(
+            locale=kwargs.get("locale"), order_by=kwargs.get("order_by")
+        )
+        cls._page_params(
+            params, limit=kwargs.get("limit"), offset=kwargs.get("offset")
+        )
+        cls._filter_params(
+            params,
+            ids=kwargs.get("ids"),
+            query=kwargs.get("query"),
+            fields=kwargs.get("fields"),
+        )
+        return params
+
+    @classmethod
+    def _list_tags_params(cls, kwargs: Mapping[str, Any]) -> dict[str, Any]:
+        cls._page_params(
+            params := {}, offset=kwargs.get("offset"), limit=kwargs.get("limit")
+        )
+        cls._filter_params(params, query=kwargs.get("query"))
+        return params
+
+    @staticmethod
+    def _count_params(params: dict[str, Any]) -> dict[str, Any]:
+        params.pop("page[offset]", None)
+        params["page[limit]"] = 1
+        return params
+
     @staticmethod
     def _upload_params(
         path: str | None = None,
@@ -302,6 +595,7 @@ class BaseClient:
         environment: str | None = None,
         include_drafts: bool = False,
         exclude_invalid: bool | None = None,
+        cache_tags: bool = False,
     ) -> dict[str, str]:
         headers = {"Content-Type": "application/json"}
         if environment is not None:
@@ -310,8 +604,41 @@ class BaseClient:
             headers["X-Include-Drafts"] = "true"
         if exclude_invalid is not None:
             headers["X-Exclude-Invalid"] = "true" if exclude_invalid else "false"
+        if cache_tags:
+            headers["X-Cache-Tags"] = "true"
         return headers
 
+    def _graphql_key(
+        self, query: str, variables: Mapping[str, Any] | None, kwargs: Mapping[str, Any]
+    ) -> str | None:
+        if self._graphql_cache is None:
+            return None
+        # the digest ignores key order and surrounding whitespace only
+        key = {
+            "endpoint": self.graphql_url,
+            "token": self._auth.digest,
+            "query": query.strip(),
+            "variables": variables or {},
+            "environment": kwargs.get("environment"),
+            "include_drafts": bool(kwargs.get("include_drafts", False)),
+            "exclude_invalid": kwargs.get("exclude_invalid"),
+        }
+        return sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _graphql_lookup(self, key: str | None) -> Any:
+        if key is None or self._graphql_cache is None:
+            return MISSING
+        return self._graphql_cache.get(key, MISSING)
+
+    def _graphql_store(self, key: str | None, response: "Response", data: Any):
+        if key is not None and self._graphql_cache is not None:
+            self._graphql_cache.set(
+                key,
+                data,
+                tags=response.headers.get("X-Cache-Tags", "").split(),
+                size=len(response.content),
+            )
+
     @abstractmethod
     def execute(
         self,
@@ -408,6 +735,19 @@ class BaseClient:
         **kwargs: "Unpack[ListTagsWithPaginationParams]",
     ) -> "Returnable[tuple[list[UploadTag], int]]": ...
 
+    @abstractmethod
+    def count_records(
+        self, **kwargs: "Unpack[CountRecordsParams]"
+    ) -> "Returnable[int]": ...
+
+    @abstractmethod
+    def count_uploads(
+        self, **kwargs: "Unpack[CountUploadsParams]"
+    ) -> "Returnable[int]": ...
+
+    @abstractmethod
+    def count_tags(self, **kwargs: "Unpack[CountTagsParams]") -> "Returnable[int]": ...
+
     @abstractmethod
     def update_upload(
         self,
@@ -0,0 +1,351 @@
+from typing import Any, Iterable, Protocol
+from collections import OrderedDict
+from os import PathLike, getpid
+from threading import Lock
+from time import monotonic, time
+from urllib.parse import urlencode
+import pickle
+import sqlite3
+import zlib
+
+
+__all__ = ["CacheBackend", "MemoryCache", "SQLiteCache", "RedisCache", "cache_key"]
+
+
+def cache_key(url: str, params: dict[str, Any] | None = None, /) -> str:
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str, default: Any = None) -> Any: ...
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        *,
+        tags: Iterable[str] = (),
+        size: int = 0,
+    ): ...
+
+    def delete(self, key: str): ...
+
+    def purge(self, *tags: str) -> int: ...
+
+    def clear(self): ...
+
+
+# values shared between processes are pickled, the store has to be trusted
+def _dumps(value: Any, level: int) -> bytes:
+    return zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL), level)
+
+
+def _loads(data: bytes) -> Any:
+    return pickle.loads(zlib.decompress(data))
+
+
+class MemoryCache:
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._tags: dict[str, set[str]] = {}
+        self._keys: dict[str, tuple[str, ...]] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if (entry := self._data.get(key)) is None:
+                self.misses += 1
+                return default
+            expires, value = entry
+            if expires is not None and expires <= monotonic():
+                self._remove(key)
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        *,
+        tags: Iterable[str] = (),
+        size: int = 0,
+    ):
+        ttl = ttl if ttl is not None else self.ttl
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (None if ttl is None else monotonic() + ttl, value)
+            if size:
+                self._sizes[key] = size
+                self.size += size
+            if tags := tuple(tags):
+                self._keys[key] = tags
+                for tag in tags:
+                    self._tags.setdefault(tag, set()).add(key)
+            # the newest entry stays even when it alone exceeds the bounds
+            while len(self._data) > 1 and (
+                len(self._data) > self.maxsize
+                or (self.max_bytes is not None and self.size > self.max_bytes)
+            ):
+                self._remove(next(iter(self._data)))
+
+    def _remove(self, key: str):
+        del self._data[key]
+        self.size -= self._sizes.pop(key, 0)
+        for tag in self._keys.pop(key, ()):
+            if (keys := self._tags.get(tag)) is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def purge(self, *tags: str) -> int:
+        with self._lock:
+            keys = set().union(*(self._tags.get(tag, ()) for tag in tags))
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._tags.clear()
+            self._keys.clear()
+            self.size = self.hits = self.misses = 0
+
+
+class SQLiteCache:
+    _schema = (
+        "CREATE TABLE IF NOT EXISTS entries ("
+        " key TEXT PRIMARY KEY, value BLOB NOT NULL,"
+        " expires REAL, accessed REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)",
+        "CREATE TABLE IF NOT EXISTS tags ("
+        " tag TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (tag, key))",
+        "CREATE INDEX IF NOT EXISTS tags_key ON tags (key)",
+    )
+
+    def __init__(
+        self,
+        path: "PathLike | str",
+        *,
+        maxsize: int | None = None,
+        ttl: float | None = None,
+        level: int = 6,
+    ):
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.level = level
+        self.hits = 0
+        self.misses = 0
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self._lock = Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # a connection must not be shared with a forked child
+        if self._connection is None or self._pid != getpid():
+            connection = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in self._schema:
+                connection.execute(statement)
+            self._connection, self._pid = connection, getpid()
+        return self._connection
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        now = time()
+        with self._lock:
+            db = self._connect()
+            row = db.execute(
+                "SELECT value, expires FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                if row is not None:
+                    self._delete(db, key)
+                self.misses += 1
+                return default
+            db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return _loads(row[0])
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        *,
+        tags: Iterable[str] = (),
+        size: int = 0,
+    ):
+        ttl = ttl if ttl is not None else self.ttl
+        now = time()
+        data = _dumps(value, self.level)
+        with self._lock:
+            db = self._connect()
+            with db:
+                db.execute("BEGIN IMMEDIATE")
+                db.execute("DELETE FROM tags WHERE key = ?", (key,))
+                db.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                    (key, data, None if ttl is None else now + ttl, now),
+                )
+                db.executemany(
+                    "INSERT OR IGNORE INTO tags VALUES (?, ?)",
+                    [(tag, key) for tag in tags],
+                )
+                if self.maxsize is not None:
+                    db.execute(
+                        "DELETE FROM entries WHERE key IN (SELECT key FROM entries"
+                        " ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                        (self.maxsize,),
+                    )
+                    db.execute(
+                        "DELETE FROM tags WHERE key NOT IN (SELECT key FROM entries)"
+                    )
+
+    def _delete(self, db: sqlite3.Connection, key: str):
+        with db:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            db.execute("DELETE FROM tags WHERE key = ?", (key,))
+
+    def delete(self, key: str):
+        with self._lock:
+            self._delete(self._connect(), key)
+
+    def purge(self, *tags: str) -> int:
+        if not tags:
+            return 0
+        marks = ",".join("?" * len(tags))
+        with self._lock:
+            db = self._connect()
+            with db:
+                db.execute("BEGIN IMMEDIATE")
+                keys = {
+                    key
+                    for (key,) in db.execute(
+                        f"SELECT key FROM tags WHERE tag IN ({marks})", tags
+                    )
+                }
+                db.executemany(
+                    "DELETE FROM entries WHERE key = ?", [(key,) for key in keys]
+                )
+                db.executemany(
+                    "DELETE FROM tags WHERE key = ?", [(key,) for key in keys]
+                )
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            db = self._connect()
+            with db:
+                db.execute("BEGIN IMMEDIATE")
+                db.execute("DELETE FROM entries")
+                db.execute("DELETE FROM tags")
+            self.hits = self.misses = 0
+
+    def close(self):
+        if self._connection is not None and self._pid == getpid():
+            self._connection.close()
+        self._connection = None
+
+
+class RedisCache:
+    def __init__(
+        self,
+        client: Any,
+        *,
+        prefix: str = "datocms:",
+        ttl: float | None = None,
+        level: int = 6,
+    ):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.level = level
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}entry:{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if (data := self.client.get(self._key(key))) is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return _loads(data)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        *,
+        tags: Iterable[str] = (),
+        size: int = 0,
+    ):
+        ttl = ttl if ttl is not None else self.ttl
+        px = None if ttl is None else max(1, int(ttl * 1000))
+        self.client.set(self._key(key), _dumps(value, self.level), px=px)
+        # the tag sets may keep expired keys around, purging them is harmless
+        for tag in tags:
+            self.client.sadd(self._tag(tag), key)
+
+    def delete(self, key: str):
+        self.client.delete(self._key(key))
+
+    def purge(self, *tags: str) -> int:
+        keys: set[str] = set()
+        for tag in tags:
+            keys.update(
+                member.decode() if isinstance(member, bytes) else member
+                for member in self.client.smembers(self._tag(tag))
+            )
+        removed = self.client.delete(*map(self._key, keys)) if keys else 0
+        if tags:
+            self.client.delete(*map(self._tag, tags))
+        return removed
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=f"{self.prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+        self.hits = self.misses = 0
@@ -0,0 +1,63 @@
+from typing import Any, Mapping, Iterable, Self
+from dataclasses import dataclass, field, asdict
+from os import PathLike, replace
+import json
+
+
+__all__ = ["Checkpoint"]
+
+
+def _plain(value: Any, /) -> Any:
+    if isinstance(value, Mapping):
+        return {str(k): _plain(v) for k, v in value.items()}
+    elif isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return value
+    elif isinstance(value, Iterable):
+        return [_plain(v) for v in value]
+    else:
+        raise TypeError(f"Cannot store {type(value).__name__} in a checkpoint")
+
+
+@dataclass
+class Checkpoint:
+    offset: int = 0
+    page_size: int | None = None
+    keyset: str | None = None
+    value: Any = None
+    seen: list[str] = field(default_factory=list)
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], /) -> Self:
+        return cls(**data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def load(cls, path: "PathLike | str", /) -> Self:
+        with open(path, "r") as fp:
+            return cls.from_dict(json.load(fp))
+
+    def dump(self, path: "PathLike | str", /):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as fp:
+            json.dump(self.to_dict(), fp)
+        replace(tmp, path)
+
+    def resume(
+        self, page_size: int | None, keyset: str | None, params: Mapping[str, Any]
+    ) -> tuple[int | None, str | None, dict[str, Any]]:
+        self.page_size = page_size or self.page_size
+        self.keyset = keyset or self.keyset
+        for name, value in params.items():
+            if name != "timeout":
+                self.params[name] = _plain(value)
+        return self.page_size, self.keyset, {**params, **self.params}
+
+    def advance(self, id: str, value: Any = None):
+        self.offset += 1
+        if self.keyset is not None:
+            if value != self.value:
+                self.value, self.seen = value, []
+            self.seen.append(id)
@@ -0,0 +1,126 @@
+from typing import Any, Protocol
+from sys import intern
+import json
+
+
+__all__ = [
+    "JsonCodec",
+    "StdlibCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "InterningCodec",
+    "default_codec",
+]
+
+
+class JsonCodec(Protocol):
+    def loads(self, data: bytes | str, /) -> Any: ...
+
+    def dumps(self, obj: Any, /) -> bytes: ...
+
+
+class StdlibCodec:
+    def loads(self, data: bytes | str, /) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, /) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class OrjsonCodec:
+    def __init__(self):
+        import orjson
+
+        self.loads = orjson.loads
+        self.dumps = orjson.dumps
+
+
+class MsgspecCodec:
+    def __init__(self):
+        from msgspec.json import Decoder, Encoder
+
+        self.loads = Decoder().decode
+        self.dumps = Encoder().encode
+
+
+def _is_reference(obj: dict[str, Any], /) -> bool:
+    return isinstance(obj["id"], str) and isinstance(obj["type"], str)
+
+
+def _key(obj: dict[str, Any], /) -> tuple[Any, ...]:
+    return obj.get("id"), obj.get("type")
+
+
+class InterningCodec:
+    def __init__(
+        self,
+        codec: JsonCodec | None = None,
+        *,
+        max_length: int = 32,
+        max_size: int = 100_000,
+    ):
+        self._codec = codec or default_codec()
+        self.max_length = max_length
+        self.max_size = max_size
+        self._strings: dict[str, str] = {}
+        self._shared: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+    def loads(self, data: bytes | str, /) -> Any:
+        return self.share(self._codec.loads(data))
+
+    def dumps(self, obj: Any, /) -> bytes:
+        return self._codec.dumps(obj)
+
+    def clear(self):
+        self._strings.clear()
+        self._shared.clear()
+
+    def _string(self, value: str, /) -> str:
+        if len(value) > self.max_length:
+            return value
+        strings = self._strings
+        if (cached := strings.get(value)) is None:
+            # a full table mostly holds one-off values, start it over
+            if len(strings) >= self.max_size:
+                strings.clear()
+            cached = strings.setdefault(value, value)
+        return cached
+
+    def _reference(self, key: tuple[Any, ...], value: dict[str, Any]):
+        shared = self._shared
+        if (cached := shared.get(key)) is None:
+            if len(shared) >= self.max_size:
+                shared.clear()
+            cached = shared.setdefault(key, value)
+        return cached
+
+    def share(self, obj: Any, /) -> Any:
+        # the shared relationship objects are the same dict in every result,
+        # so the decoded data has to be treated as read-only
+        if isinstance(obj, str):
+            return self._string(obj)
+        elif isinstance(obj, list):
+            return [self.share(value) for value in obj]
+        elif not isinstance(obj, dict):
+            return obj
+        elif obj.keys() == {"id", "type"} and _is_reference(obj):
+            id, type = self._string(obj["id"]), self._string(obj["type"])
+            return self._reference((id, type), {"id": id, "type": type})
+        elif obj.keys() == {"data"}:
+            data = self.share(obj["data"])
+            if data is None:
+                return self._reference(("data",), {"data": None})
+            elif isinstance(data, dict) and self._shared.get(_key(data)) is data:
+                return self._reference(("data", *_key(data)), {"data": data})
+            return {"data": data}
+        else:
+            return {intern(key): self.share(value) for key, value in obj.items()}
+
+
+def default_codec() -> JsonCodec:
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            continue
+    return StdlibCodec()
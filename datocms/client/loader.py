@@ -0,0 +1,141 @@
+from typing import Any, Awaitable, Callable, Iterable
+from asyncio import (
+    AbstractEventLoop,
+    Future as AsyncFuture,
+    Handle,
+    Task,
+    TimerHandle,
+    get_running_loop,
+)
+from concurrent.futures import Future
+from threading import Lock, Timer
+
+
+__all__ = ["BatchLoader", "AsyncBatchLoader"]
+
+
+DEFAULT_BATCH_DELAY = 0.005
+DEFAULT_MAX_BATCH = 500
+
+
+def _resolve(futures: dict[str, Any], items: Iterable[Any]):
+    found = {item["id"]: item for item in items}
+    for id, future in futures.items():
+        if future.done():
+            continue
+        elif id in found:
+            future.set_result(found[id])
+        else:
+            future.set_exception(KeyError(id))
+
+
+def _reject(futures: dict[str, Any], err: BaseException):
+    for future in futures.values():
+        if not future.done():
+            future.set_exception(err)
+
+
+class BatchLoader:
+    def __init__(
+        self,
+        fetch: Callable[[list[str]], list[Any]],
+        *,
+        delay: float = DEFAULT_BATCH_DELAY,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        self._fetch = fetch
+        self.delay = delay
+        self.max_batch = max_batch
+        self._lock = Lock()
+        self._pending: dict[str, Future] = {}
+        self._timer: Timer | None = None
+
+    def _take(self) -> dict[str, Future]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        return batch
+
+    def _run(self, batch: dict[str, Future]):
+        try:
+            items = self._fetch(list(batch))
+        except Exception as err:
+            _reject(batch, err)
+        else:
+            _resolve(batch, items)
+
+    def submit(self, id: str) -> Future:
+        batch = None
+        with self._lock:
+            if (future := self._pending.get(id)) is None:
+                future = self._pending[id] = Future()
+                if len(self._pending) >= self.max_batch:
+                    batch = self._take()
+                elif self._timer is None:
+                    self._timer = Timer(self.delay, self.dispatch)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            self._run(batch)
+        return future
+
+    def load(self, id: str) -> Any:
+        return self.submit(id).result()
+
+    def dispatch(self):
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._run(batch)
+
+
+class AsyncBatchLoader:
+    def __init__(
+        self,
+        fetch: Callable[[list[str]], Awaitable[list[Any]]],
+        *,
+        delay: float = 0.0,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        self._fetch = fetch
+        self.delay = delay
+        self.max_batch = max_batch
+        self._pending: dict[str, AsyncFuture] = {}
+        self._handle: Handle | TimerHandle | None = None
+        self._tasks: set[Task] = set()
+
+    def _schedule(self, loop: AbstractEventLoop):
+        # without a delay the batch closes at the next tick of the event loop
+        if self.delay > 0:
+            self._handle = loop.call_later(self.delay, self.dispatch)
+        else:
+            self._handle = loop.call_soon(self.dispatch)
+
+    async def _run(self, batch: dict[str, AsyncFuture]):
+        try:
+            items = await self._fetch(list(batch))
+        except Exception as err:
+            _reject(batch, err)
+        else:
+            _resolve(batch, items)
+
+    def dispatch(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def load(self, id: str) -> Any:
+        loop = get_running_loop()
+        if (future := self._pending.get(id)) is None:
+            future = self._pending[id] = loop.create_future()
+            if len(self._pending) >= self.max_batch:
+                self.dispatch()
+            elif self._handle is None:
+                self._schedule(loop)
+        return await future
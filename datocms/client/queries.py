@@ -0,0 +1,102 @@
+from os import PathLike, fspath, stat
+from os.path import abspath
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+import re
+
+
+__all__ = ["QueryStore", "minify"]
+
+
+DEFAULT_CHECK_INTERVAL = 1.0
+
+_TOKENS = re.compile(
+    r'"""(?:\\"""|(?!""")[\s\S])*"""'  # block string, kept verbatim
+    r'|"(?:\\.|[^"\\\n\r])*"'  # string
+    r"|#[^\n\r]*"  # comment
+    r"|[\s,\ufeff]+"  # ignored tokens, commas included
+    r'|[^\s,\ufeff"#]+'
+    r'|"'
+)
+_WORD = re.compile(r"\w")
+
+
+def minify(query: str, /) -> str:
+    parts: list[str] = []
+    separated = False
+    for match in _TOKENS.finditer(query):
+        token = match.group()
+        if token[0] == "#" or token[0] in " \t\n\r,\ufeff":
+            separated = True
+            continue
+        # names and numbers only need a space when they would run together
+        if (
+            separated
+            and parts
+            and _WORD.match(parts[-1][-1])
+            and _WORD.match(token[0])
+        ):
+            parts.append(" ")
+        parts.append(token)
+        separated = False
+    return "".join(parts)
+
+
+class QueryStore:
+    def __init__(
+        self,
+        *,
+        minified: bool = True,
+        check_interval: float | None = DEFAULT_CHECK_INTERVAL,
+    ):
+        self.minified = minified
+        self.check_interval = check_interval
+        self._queries: dict[str, tuple[int, float, str]] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    @staticmethod
+    def _key(path: "PathLike | str", /) -> str:
+        return abspath(fspath(path))
+
+    def _load(self, key: str) -> str:
+        mtime = stat(key).st_mtime_ns
+        with open(key, "r") as fp:
+            query = fp.read()
+        if self.minified:
+            query = minify(query)
+        with self._lock:
+            self._queries[key] = (mtime, monotonic(), query)
+        return query
+
+    def get(self, path: "PathLike | str", /) -> str:
+        key = self._key(path)
+        if (entry := self._queries.get(key)) is None:
+            return self._load(key)
+        mtime, checked, query = entry
+        # the file is stat-ed at most once per interval, never without one
+        if self.check_interval is None or monotonic() - checked < self.check_interval:
+            return query
+        if stat(key).st_mtime_ns != mtime:
+            return self._load(key)
+        with self._lock:
+            self._queries[key] = (mtime, monotonic(), query)
+        return query
+
+    def preload(
+        self, directory: "PathLike | str", pattern: str = "**/*.graphql"
+    ) -> int:
+        paths = [path for path in Path(directory).glob(pattern) if path.is_file()]
+        for path in paths:
+            self._load(self._key(path))
+        return len(paths)
+
+    def invalidate(self, path: "PathLike | str | None" = None):
+        with self._lock:
+            if path is None:
+                self._queries.clear()
+            else:
+                self._queries.pop(self._key(path), None)
@@ -0,0 +1,80 @@
+from typing import Protocol
+from os import PathLike, open as os_open, close, pread, pwrite, getpid, O_RDWR, O_CREAT
+from threading import Lock
+from time import monotonic, time
+from struct import Struct
+
+
+__all__ = ["RateLimiter", "TokenBucket", "FileTokenBucket"]
+
+
+class RateLimiter(Protocol):
+    def reserve(self, tokens: float = 1.0) -> float: ...
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def _take(self, tokens: float, available: float, elapsed: float) -> float:
+        # the balance may go negative, later callers queue up behind it
+        return min(self.capacity, available + elapsed * self.rate) - tokens
+
+    def _delay(self, available: float) -> float:
+        return max(0.0, -available / self.rate)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            now = monotonic()
+            self._tokens = self._take(tokens, self._tokens, now - self._updated)
+            self._updated = now
+            return self._delay(self._tokens)
+
+
+class FileTokenBucket(TokenBucket):
+    _state = Struct("dd")
+
+    def __init__(
+        self, path: "PathLike | str", rate: float, capacity: float | None = None
+    ):
+        super().__init__(rate, capacity)
+        self.path = path
+        self._fd: int | None = None
+        self._pid: int | None = None
+
+    def _open(self) -> int:
+        # flock is shared by forked children holding the same descriptor
+        if self._fd is None or self._pid != getpid():
+            self._fd = os_open(self.path, O_RDWR | O_CREAT, 0o644)
+            self._pid = getpid()
+        return self._fd
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        from fcntl import flock, LOCK_EX, LOCK_UN
+
+        with self._lock:
+            fd = self._open()
+            flock(fd, LOCK_EX)
+            try:
+                now = time()
+                raw = pread(fd, self._state.size, 0)
+                if len(raw) == self._state.size:
+                    available, updated = self._state.unpack(raw)
+                else:
+                    available, updated = self.capacity, now
+                available = self._take(tokens, available, max(now - updated, 0.0))
+                pwrite(fd, self._state.pack(available, now), 0)
+            finally:
+                flock(fd, LOCK_UN)
+        return self._delay(available)
+
+    def close(self):
+        if self._fd is not None and self._pid == getpid():
+            close(self._fd)
+        self._fd = None
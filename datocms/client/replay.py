@@ -0,0 +1,210 @@
+from typing import Any, Literal
+from os import PathLike
+from base64 import b64decode, b64encode
+from hashlib import sha1
+from threading import Lock
+from time import perf_counter, sleep
+import asyncio
+import gzip
+import json
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncHTTPTransport,
+    BaseTransport,
+    HTTPTransport,
+    Request,
+    RequestNotRead,
+    Response,
+)
+
+
+__all__ = [
+    "RecordingTransport",
+    "AsyncRecordingTransport",
+    "ReplayTransport",
+    "AsyncReplayTransport",
+]
+
+
+# the recorded body is already decoded, so the framing headers no longer apply
+_SKIP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def _key(request: Request, /) -> tuple[str, str, str | None]:
+    url = request.url.copy_with(params=sorted(request.url.params.multi_items()))
+    digest = None
+    if request.method == "POST":
+        try:
+            digest = sha1(request.content).hexdigest()
+        except RequestNotRead:
+            pass
+    return request.method, str(url), digest
+
+
+def _headers(response: Response, /) -> list[tuple[str, str]]:
+    return [
+        (k, v)
+        for k, v in response.headers.multi_items()
+        if k.lower() not in _SKIP_HEADERS
+    ]
+
+
+def _exchange(request: Request, response: Response, elapsed: float) -> dict[str, Any]:
+    method, url, digest = _key(request)
+    exchange = {
+        "method": method,
+        "url": url,
+        "digest": digest,
+        "status": response.status_code,
+        "headers": _headers(response),
+        "elapsed": round(elapsed, 6),
+    }
+    try:
+        exchange["text"] = response.content.decode()
+    except UnicodeDecodeError:
+        exchange["base64"] = b64encode(response.content).decode()
+    return exchange
+
+
+def _response(exchange: dict[str, Any], request: Request) -> Response:
+    if (text := exchange.get("text")) is not None:
+        content = text.encode()
+    else:
+        content = b64decode(exchange.get("base64", ""))
+    return Response(
+        exchange["status"],
+        headers=exchange["headers"],
+        content=content,
+        request=request,
+    )
+
+
+class _Recorder:
+    def __init__(self, path: "PathLike | str"):
+        self.path = path
+        self._file = gzip.open(path, "at", encoding="utf-8")
+        self._lock = Lock()
+
+    def record(self, request: Request, response: Response, elapsed: float):
+        line = json.dumps(_exchange(request, response, elapsed), ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class _Cassette:
+    def __init__(
+        self, path: "PathLike | str", latency: float | Literal["recorded"] = 0.0
+    ):
+        self.latency = latency
+        self._exchanges: dict[tuple, list[dict[str, Any]]] = {}
+        self._played: dict[tuple, int] = {}
+        self._lock = Lock()
+        with gzip.open(path, "rt", encoding="utf-8") as fp:
+            for line in fp:
+                exchange = json.loads(line)
+                key = exchange["method"], exchange["url"], exchange["digest"]
+                self._exchanges.setdefault(key, []).append(exchange)
+
+    def play(self, request: Request) -> tuple[Response, float]:
+        key = _key(request)
+        if (exchanges := self._exchanges.get(key)) is None:
+            raise KeyError(f"No recorded response for {key[0]} {key[1]}")
+        # repeated requests replay in order, the last response sticks
+        with self._lock:
+            index = self._played.get(key, 0)
+            self._played[key] = min(index + 1, len(exchanges) - 1)
+        exchange = exchanges[index]
+        if self.latency == "recorded":
+            delay = exchange["elapsed"]
+        else:
+            delay = self.latency
+        return _response(exchange, request), delay
+
+
+class RecordingTransport(BaseTransport):
+    def __init__(
+        self, path: "PathLike | str", transport: BaseTransport | None = None
+    ):
+        self._transport = transport or HTTPTransport()
+        self._recorder = _Recorder(path)
+
+    def handle_request(self, request: Request) -> Response:
+        started = perf_counter()
+        response = self._transport.handle_request(request)
+        try:
+            content = response.read()
+        finally:
+            response.close()
+        self._recorder.record(request, response, perf_counter() - started)
+        return Response(
+            response.status_code,
+            headers=_headers(response),
+            content=content,
+            extensions=response.extensions,
+            request=request,
+        )
+
+    def close(self):
+        self._transport.close()
+        self._recorder.close()
+
+
+class AsyncRecordingTransport(AsyncBaseTransport):
+    def __init__(
+        self, path: "PathLike | str", transport: AsyncBaseTransport | None = None
+    ):
+        self._transport = transport or AsyncHTTPTransport()
+        self._recorder = _Recorder(path)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        started = perf_counter()
+        response = await self._transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        self._recorder.record(request, response, perf_counter() - started)
+        return Response(
+            response.status_code,
+            headers=_headers(response),
+            content=content,
+            extensions=response.extensions,
+            request=request,
+        )
+
+    async def aclose(self):
+        await self._transport.aclose()
+        self._recorder.close()
+
+
+class ReplayTransport(BaseTransport):
+    def __init__(
+        self, path: "PathLike | str", *, latency: float | Literal["recorded"] = 0.0
+    ):
+        self._cassette = _Cassette(path, latency)
+
+    def handle_request(self, request: Request) -> Response:
+        request.read()
+        response, delay = self._cassette.play(request)
+        if delay > 0:
+            sleep(delay)
+        return response
+
+
+class AsyncReplayTransport(AsyncBaseTransport):
+    def __init__(
+        self, path: "PathLike | str", *, latency: float | Literal["recorded"] = 0.0
+    ):
+        self._cassette = _Cassette(path, latency)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        await request.aread()
+        response, delay = self._cassette.play(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return response
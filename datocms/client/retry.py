@@ -0,0 +1,121 @@
+from typing import Any
+from contextvars import ContextVar
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from random import uniform
+
+from httpx import (
+    Response,
+    TransportError,
+    TimeoutException,
+    ConnectError,
+    ConnectTimeout,
+    PoolTimeout,
+)
+
+
+__all__ = [
+    "RetryPolicy",
+    "RETRY_CODES",
+    "IDEMPOTENT_METHODS",
+    "IDEMPOTENT_EXTENSION",
+]
+
+
+RETRY_CODES = frozenset({"RATE_LIMIT_EXCEEDED", "SERVICE_UNAVAILABLE"})
+RETRY_STATUSES = frozenset({502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# request extension marking a read-only POST, such as a GraphQL query
+IDEMPOTENT_EXTENSION = "datocms.idempotent"
+
+# the request never reached the server, so it is safe to send again
+_UNSENT_ERRORS = (ConnectError, ConnectTimeout, PoolTimeout)
+
+# cleared around requests whose caller reacts to a timeout itself
+retry_timeouts: ContextVar[bool] = ContextVar("retry_timeouts", default=True)
+
+
+def _retry_after(response: Response, /) -> float | None:
+    if (value := response.headers.get("Retry-After")) is not None:
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    if (value := response.headers.get("X-RateLimit-Reset")) is not None:
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            return None
+    return None
+
+
+def _error_attributes(response: Response, /) -> list[dict[str, Any]]:
+    if "application/json" not in response.headers.get("Content-Type", ""):
+        return []
+    try:
+        data = response.json().get("data")
+    except (ValueError, AttributeError):
+        return []
+    if not isinstance(data, list):
+        return []
+    return [item.get("attributes") or {} for item in data if isinstance(item, dict)]
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 5
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+
+    def backoff_delay(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff * 2**attempt)
+        return uniform(0, delay) if self.jitter else delay
+
+    def retryable(
+        self, method: str, response: Response, idempotent: bool | None = None
+    ) -> bool:
+        if response.status_code == 429:
+            return True
+        errors = _error_attributes(response)
+        if any(e.get("transient") or e.get("code") in RETRY_CODES for e in errors):
+            return True
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        return idempotent and response.status_code in RETRY_STATUSES
+
+    def delay(
+        self,
+        attempt: int,
+        method: str,
+        response: Response | None = None,
+        error: TransportError | None = None,
+        *,
+        idempotent: bool | None = None,
+        timeouts: bool = True,
+    ) -> float | None:
+        if attempt >= self.max_retries:
+            return None
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        if error is not None:
+            if not timeouts and isinstance(error, TimeoutException):
+                if not isinstance(error, _UNSENT_ERRORS):
+                    return None
+            if idempotent or isinstance(error, _UNSENT_ERRORS):
+                return self.backoff_delay(attempt)
+            return None
+        if response is None or response.is_success:
+            return None
+        if not self.retryable(method, response, idempotent):
+            return None
+        delay = self.backoff_delay(attempt)
+        if (hint := _retry_after(response)) is not None:
+            delay = max(delay, hint)
+        return delay
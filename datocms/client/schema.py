@@ -0,0 +1,215 @@
+from typing import Any, Mapping, Self, TYPE_CHECKING
+from dataclasses import dataclass, field, asdict, is_dataclass
+from concurrent.futures import ThreadPoolExecutor
+from asyncio import Lock as AsyncLock, Semaphore, gather
+from os import PathLike, replace
+from threading import Lock
+from time import time
+import json
+
+from .base import DEFAULT_CONCURRENCY
+from ..compact import Model, Field, convert
+
+if TYPE_CHECKING:
+    from ._sync import Client
+    from ._async import AsyncClient
+
+
+__all__ = ["Schema", "SchemaRegistry", "AsyncSchemaRegistry"]
+
+
+DEFAULT_SCHEMA_TTL = 300.0
+
+
+def _plain(value: Any, /) -> Any:
+    return asdict(value) if is_dataclass(value) else value
+
+
+@dataclass
+class Schema:
+    models: list[Any]
+    fields: dict[str, list[Any]]
+    loaded_at: float = field(default_factory=time)
+
+    def __post_init__(self):
+        self._models = {model["id"]: model for model in self.models}
+        self._api_keys = {
+            model["attributes"]["api_key"]: model for model in self.models
+        }
+        self._fields = {
+            (model_id, item["attributes"]["api_key"]): item
+            for model_id, items in self.fields.items()
+            for item in items
+        }
+        self._field_ids = {
+            item["id"]: item for items in self.fields.values() for item in items
+        }
+
+    def expired(self, ttl: float | None) -> bool:
+        return ttl is not None and time() - self.loaded_at >= ttl
+
+    def model(self, key: str, /) -> Any:
+        if (model := self._models.get(key)) is not None:
+            return model
+        return self._api_keys[key]
+
+    def model_fields(self, model: str, /) -> list[Any]:
+        return self.fields[self.model(model)["id"]]
+
+    def field(self, model: str, key: str, /) -> Any:
+        return self._fields[self.model(model)["id"], key]
+
+    def field_by_id(self, id: str, /) -> Any:
+        return self._field_ids[id]
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], /) -> Self:
+        return cls(**data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "models": [_plain(model) for model in self.models],
+            "fields": {
+                model_id: [_plain(item) for item in items]
+                for model_id, items in self.fields.items()
+            },
+            "loaded_at": self.loaded_at,
+        }
+
+    @classmethod
+    def load(cls, path: "PathLike | str", /) -> Self:
+        with open(path, "r") as fp:
+            return cls.from_dict(json.load(fp))
+
+    def dump(self, path: "PathLike | str", /):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as fp:
+            json.dump(self.to_dict(), fp)
+        replace(tmp, path)
+
+
+class _Registry:
+    _client: "Client | AsyncClient"
+
+    def __init__(
+        self,
+        *,
+        ttl: float | None = DEFAULT_SCHEMA_TTL,
+        path: "PathLike | str | None" = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        self.ttl = ttl
+        self.path = path
+        self.concurrency = concurrency
+        self._schema: Schema | None = None
+
+    def _warm(self) -> Schema | None:
+        if self.path is None:
+            return None
+        try:
+            schema = Schema.load(self.path)
+        except (OSError, ValueError, TypeError):
+            return None
+        if schema.expired(self.ttl):
+            return None
+        if self._client._compact:
+            schema = Schema(
+                convert(schema.models, list[Model]),
+                {k: convert(v, list[Field]) for k, v in schema.fields.items()},
+                schema.loaded_at,
+            )
+        return schema
+
+    def _stored(self, schema: Schema) -> Schema:
+        if self.path is not None:
+            schema.dump(self.path)
+        self._schema = schema
+        return schema
+
+    def invalidate(self):
+        self._schema = None
+
+
+class SchemaRegistry(_Registry):
+    def __init__(self, client: "Client", **kwargs):
+        super().__init__(**kwargs)
+        self._client = client
+        self._lock = Lock()
+
+    def _fetch(self) -> Schema:
+        models = self._client.list_models()
+        workers = max(1, min(self.concurrency, len(models)))
+        with ThreadPoolExecutor(workers) as executor:
+            fields = executor.map(
+                lambda model: self._client.list_fields(model["id"]), models
+            )
+            ids = (model["id"] for model in models)
+            return Schema(models, dict(zip(ids, fields, strict=True)))
+
+    @property
+    def schema(self) -> Schema:
+        if (schema := self._schema) is not None and not schema.expired(self.ttl):
+            return schema
+        with self._lock:
+            if (schema := self._schema) is None or schema.expired(self.ttl):
+                if (schema := self._warm()) is not None:
+                    self._schema = schema
+                else:
+                    schema = self._stored(self._fetch())
+            return schema
+
+    def refresh(self) -> Schema:
+        with self._lock:
+            return self._stored(self._fetch())
+
+    def model(self, key: str, /) -> Any:
+        return self.schema.model(key)
+
+    def fields(self, model: str, /) -> list[Any]:
+        return self.schema.model_fields(model)
+
+    def field(self, model: str, key: str, /) -> Any:
+        return self.schema.field(model, key)
+
+
+class AsyncSchemaRegistry(_Registry):
+    def __init__(self, client: "AsyncClient", **kwargs):
+        super().__init__(**kwargs)
+        self._client = client
+        self._lock = AsyncLock()
+
+    async def _fetch(self) -> Schema:
+        models = await self._client.list_models()
+        limiter = Semaphore(self.concurrency)
+
+        async def fetch(model: Any) -> list[Any]:
+            async with limiter:
+                return await self._client.list_fields(model["id"])
+
+        fields = await gather(*map(fetch, models))
+        ids = (model["id"] for model in models)
+        return Schema(models, dict(zip(ids, fields, strict=True)))
+
+    async def schema(self) -> Schema:
+        if (schema := self._schema) is not None and not schema.expired(self.ttl):
+            return schema
+        async with self._lock:
+            if (schema := self._schema) is None or schema.expired(self.ttl):
+                if (schema := self._warm()) is not None:
+                    self._schema = schema
+                else:
+                    schema = self._stored(await self._fetch())
+            return schema
+
+    async def refresh(self) -> Schema:
+        async with self._lock:
+            return self._stored(await self._fetch())
+
+    async def model(self, key: str, /) -> Any:
+        return (await self.schema()).model(key)
+
+    async def fields(self, model: str, /) -> list[Any]:
+        return (await self.schema()).model_fields(model)
+
+    async def field(self, model: str, key: str, /) -> Any:
+        return (await self.schema()).field(model, key)
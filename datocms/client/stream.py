@@ -0,0 +1,122 @@
+from typing import Any
+from codecs import getincrementaldecoder
+from json import JSONDecoder, JSONDecodeError
+
+
+__all__ = ["JsonListDecoder"]
+
+
+_WHITESPACE = " \t\n\r"
+
+
+class JsonListDecoder:
+    _decoder = JSONDecoder()
+
+    def __init__(self, key: str = "data"):
+        self._key = key
+        self._text = getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._state = "start"
+        self._member = ""
+        self.document: dict[str, Any] = {}
+        self.count = 0
+
+    @property
+    def total_count(self) -> int:
+        return self.document["meta"]["total_count"]
+
+    def feed(self, chunk: bytes, /) -> list[Any]:
+        self._buffer = self._buffer[self._position :] + self._text.decode(chunk)
+        self._position = 0
+        return self._parse(final=False)
+
+    def close(self) -> list[Any]:
+        self._buffer = self._buffer[self._position :] + self._text.decode(b"", True)
+        self._position = 0
+        items = self._parse(final=True)
+        if self._state != "end":
+            raise JSONDecodeError("Unexpected end of data", self._buffer, 0)
+        return items
+
+    def _skip(self, chars: str = _WHITESPACE) -> str | None:
+        buffer, position = self._buffer, self._position
+        while position < len(buffer) and buffer[position] in chars:
+            position += 1
+        self._position = position
+        return buffer[position] if position < len(buffer) else None
+
+    def _value(self, final: bool) -> tuple[bool, Any]:
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._position)
+        except JSONDecodeError:
+            if final:
+                raise
+            return False, None
+        # a number at the end of the buffer may continue in the next chunk
+        if end == len(self._buffer) and not final:
+            return False, None
+        self._position = end
+        return True, value
+
+    def _parse(self, final: bool) -> list[Any]:
+        items: list[Any] = []
+        while (char := self._skip()) is not None:
+            match self._state:
+                case "start":
+                    if char != "{":
+                        raise JSONDecodeError("Expecting '{'", self._buffer, 0)
+                    self._position += 1
+                    self._state = "key"
+                case "key":
+                    if char == "}":
+                        self._position += 1
+                        self._state = "end"
+                    elif char == ",":
+                        self._position += 1
+                    else:
+                        complete, member = self._value(final)
+                        if not complete:
+                            break
+                        if not isinstance(member, str):
+                            raise JSONDecodeError(
+                                "Expecting property name", self._buffer, 0
+                            )
+                        self._member = member
+                        self._state = "colon"
+                case "colon":
+                    if char != ":":
+                        raise JSONDecodeError(
+                            "Expecting ':'", self._buffer, self._position
+                        )
+                    self._position += 1
+                    self._state = "value"
+                case "value":
+                    if self._member == self._key and char == "[":
+                        self._position += 1
+                        self._state = "items"
+                        self.document[self._key] = None
+                    else:
+                        complete, value = self._value(final)
+                        if not complete:
+                            break
+                        self.document[self._member] = value
+                        self._state = "key"
+                case "items":
+                    if char == "]":
+                        self._position += 1
+                        self._state = "key"
+                    elif char == ",":
+                        self._position += 1
+                    else:
+                        complete, value = self._value(final)
+                        if not complete:
+                            break
+                        items.append(value)
+                        self.count += 1
+                case "end":
+                    raise JSONDecodeError(
+                        "Extra data", self._buffer, self._position
+                    )
+        return items
+
@@ -0,0 +1,319 @@
+from typing import Any, Callable, Literal, Union, get_args, get_origin
+from types import NoneType, UnionType
+from dataclasses import dataclass, fields, is_dataclass, make_dataclass
+from functools import cache
+
+
+__all__ = [
+    "Compact",
+    "Ref",
+    "Relationship",
+    "Relationships",
+    "RecordMeta",
+    "RecordRelationships",
+    "Record",
+    "UploadAttributes",
+    "UploadRelationships",
+    "Upload",
+    "ModelAttributes",
+    "ModelRelationships",
+    "Model",
+    "FieldAttributes",
+    "FieldRelationships",
+    "Field",
+    "UploadTagAttributes",
+    "UploadTag",
+    "UploadCollectionAttributes",
+    "UploadCollectionRelationships",
+    "UploadCollection",
+    "convert",
+    "decode_data",
+    "decode_list",
+]
+
+
+class Compact:
+    __slots__ = ()
+
+    # keep the mapping access used with the plain dict results working
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
+@dataclass(slots=True)
+class Ref(Compact):
+    id: str
+    type: str
+
+
+@dataclass(slots=True)
+class Relationship(Compact):
+    data: Ref | None = None
+
+
+@dataclass(slots=True)
+class Relationships(Compact):
+    data: list[Ref]
+
+
+@dataclass(slots=True)
+class RecordMeta(Compact):
+    created_at: str | None = None
+    updated_at: str | None = None
+    published_at: str | None = None
+    first_published_at: str | None = None
+    publication_scheduled_at: str | None = None
+    unpublishing_scheduled_at: str | None = None
+    status: str | None = None
+    is_current_version_valid: bool | None = None
+    is_published_version_valid: bool | None = None
+    current_version: str | None = None
+    stage: str | None = None
+    is_valid: bool | None = None
+
+
+@dataclass(slots=True)
+class RecordRelationships(Compact):
+    item_type: Relationship | None = None
+    creator: Relationship | None = None
+
+
+@dataclass(slots=True)
+class Record(Compact):
+    id: str
+    type: Literal["item"]
+    attributes: dict[str, Any]
+    meta: RecordMeta
+    relationships: RecordRelationships
+
+
+@dataclass(slots=True)
+class UploadAttributes(Compact):
+    size: int | None = None
+    width: int | None = None
+    height: int | None = None
+    path: str | None = None
+    basename: str | None = None
+    filename: str | None = None
+    url: str | None = None
+    format: str | None = None
+    author: str | None = None
+    copyright: str | None = None
+    notes: str | None = None
+    md5: str | None = None
+    duration: int | None = None
+    frame_rate: int | None = None
+    blurhash: str | None = None
+    mux_playback_id: str | None = None
+    mux_mp4_highest_res: str | None = None
+    default_field_metadata: dict[str, Any] | None = None
+    is_image: bool | None = None
+    created_at: str | None = None
+    updated_at: str | None = None
+    mime_type: str | None = None
+    tags: list[str] | None = None
+    smart_tags: list[str] | None = None
+    exif_info: dict[str, Any] | None = None
+    colors: list[dict[str, int]] | None = None
+
+
+@dataclass(slots=True)
+class UploadRelationships(Compact):
+    creator: Relationship | None = None
+    upload_collection: Relationship | None = None
+
+
+@dataclass(slots=True)
+class Upload(Compact):
+    id: str
+    type: Literal["upload"]
+    attributes: UploadAttributes
+    relationships: UploadRelationships
+
+
+@dataclass(slots=True)
+class ModelAttributes(Compact):
+    name: str | None = None
+    api_key: str | None = None
+    singleton: bool | None = None
+    sortable: bool | None = None
+    modular_block: bool | None = None
+    tree: bool | None = None
+    ordering_direction: str | None = None
+    ordering_meta: str | None = None
+    draft_mode_active: bool | None = None
+    all_locales_required: bool | None = None
+    collection_appearance: str | None = None
+    has_singleton_item: bool | None = None
+    hint: str | None = None
+
+
+@dataclass(slots=True)
+class ModelRelationships(Compact):
+    fields: Relationships | None = None
+    field_sets: Relationships | None = None
+    singleton_item: Relationship | None = None
+    title_field: Relationship | None = None
+    image_preview_field: Relationship | None = None
+    excerpt_field: Relationship | None = None
+    ordering_field: Relationship | None = None
+    workflow: Relationship | None = None
+
+
+@dataclass(slots=True)
+class Model(Compact):
+    id: str
+    type: Literal["item_type"]
+    attributes: ModelAttributes
+    relationships: ModelRelationships
+
+
+@dataclass(slots=True)
+class FieldAttributes(Compact):
+    label: str | None = None
+    field_type: str | None = None
+    api_key: str | None = None
+    localized: bool | None = None
+    validators: dict[str, Any] | None = None
+    appearance: dict[str, Any] | None = None
+    position: int | None = None
+    hint: str | None = None
+    default_value: Any = None
+
+
+@dataclass(slots=True)
+class FieldRelationships(Compact):
+    item_type: Relationship | None = None
+    fieldset: Relationship | None = None
+
+
+@dataclass(slots=True)
+class Field(Compact):
+    id: str
+    type: Literal["field"]
+    attributes: FieldAttributes
+    relationships: FieldRelationships
+
+
+@dataclass(slots=True)
+class UploadTagAttributes(Compact):
+    name: str
+
+
+@dataclass(slots=True)
+class UploadTag(Compact):
+    id: str
+    type: Literal["upload_tag", "upload_smart_tag"]
+    attributes: UploadTagAttributes
+
+
+@dataclass(slots=True)
+class UploadCollectionAttributes(Compact):
+    label: str | None = None
+    position: int | None = None
+
+
+@dataclass(slots=True)
+class UploadCollectionRelationships(Compact):
+    parent: Relationship | None = None
+    children: Relationships | None = None
+
+
+@dataclass(slots=True)
+class UploadCollection(Compact):
+    id: str
+    type: Literal["upload_collection"]
+    attributes: UploadCollectionAttributes
+    relationships: UploadCollectionRelationships | None = None
+
+
+@dataclass(slots=True)
+class PageMeta:
+    total_count: int
+
+
+def _identity(value: Any, /) -> Any:
+    return value
+
+
+@cache
+def _converter(tp: Any, /) -> Callable[[Any], Any]:
+    origin = get_origin(tp)
+    if origin in (Union, UnionType):
+        args = [arg for arg in get_args(tp) if arg is not NoneType]
+        inner = _converter(args[0]) if len(args) == 1 else _identity
+        if inner is _identity:
+            return _identity
+        return lambda value: None if value is None else inner(value)
+    elif origin is list:
+        item = _converter(get_args(tp)[0])
+        if item is _identity:
+            return _identity
+        return lambda value: [item(v) for v in value]
+    elif is_dataclass(tp) and isinstance(tp, type):
+        members = [(f.name, _converter(f.type)) for f in fields(tp)]
+
+        def build(value: dict[str, Any], /) -> Any:
+            return tp(
+                **{
+                    name: convert(value[name])
+                    for name, convert in members
+                    if name in value
+                }
+            )
+
+        return build
+    else:
+        return _identity
+
+
+def convert[T](value: Any, tp: type[T], /) -> T:
+    return _converter(tp)(value)
+
+
+@cache
+def _data_type(tp: Any, /) -> type:
+    return make_dataclass("Data", [("data", tp)], slots=True)
+
+
+@cache
+def _page_type(tp: Any, /) -> type:
+    return make_dataclass(
+        "Page", [("data", list[tp]), ("meta", PageMeta)], slots=True
+    )
+
+
+@cache
+def _msgspec_decoder(tp: Any, /) -> Callable[[bytes], Any] | None:
+    try:
+        from msgspec.json import Decoder
+    except ImportError:
+        return None
+    return Decoder(tp).decode
+
+
+def _decode(
+    body: bytes, tp: Any, loads: Callable[[bytes], Any], direct: bool = True
+) -> Any:
+    if direct and (decode := _msgspec_decoder(tp)) is not None:
+        return decode(body)
+    return convert(loads(body), tp)
+
+
+def decode_data(
+    body: bytes, tp: Any, loads: Callable[[bytes], Any], direct: bool = True
+) -> Any:
+    return _decode(body, _data_type(tp), loads, direct).data
+
+
+def decode_list(
+    body: bytes, tp: Any, loads: Callable[[bytes], Any], direct: bool = True
+) -> tuple[list[Any], int]:
+    page = _decode(body, _page_type(tp), loads, direct)
+    return page.data, page.meta.total_count
@@ -26,6 +26,7 @@ __all__ = [
     "ErrorExtensions",
     "ErrorProblem",
     "PaginationParams",
+    "IterPaginationParams",
     "RetryParams",
     "ExecuteParams",
     "ListRecordsParams",
@@ -45,6 +46,10 @@ __all__ = [
     "ListRecordsWithPaginationParams",
     "ListUploadsWithPaginationParams",
     "ListTagsWithPaginationParams",
+    "CountParams",
+    "CountRecordsParams",
+    "CountUploadsParams",
+    "CountTagsParams",
     "CreateUploadWithRetryParams",
 ]
 
@@ -129,6 +134,15 @@ class PaginationParams(TypedDict, total=False):
     offset: int | None
 
 
+class IterPaginationParams(TypedDict, total=False):
+    concurrency: int | None
+    ordered: bool
+    prefetch: int | None
+    stream: bool
+    checkpoint: Any  # Checkpoint
+    adaptive: Any  # bool | AdaptivePageSize
+
+
 class RetryParams(TypedDict, total=False):
     max_retries: int
     retry_delay: float
@@ -154,7 +168,9 @@ class ListRecordsParams(TypedDict, total=False):
     timeout: TimeoutTypes | None
 
 
-class IterRecordsParams(TypedDict, total=False):
+class IterRecordsParams(IterPaginationParams, total=False):
+    # needs exactly one type in types and no ids
+    keyset: str | None
     nested: bool
     ids: Iterable[str] | None
     types: Iterable[str] | None
@@ -175,7 +191,7 @@ class ListUploadsParams(TypedDict, total=False):
     locale: str | None
 
 
-class IterUploadsParams(TypedDict, total=False):
+class IterUploadsParams(IterPaginationParams, total=False):
     ids: Iterable[str] | None
     query: str | None
     fields: Mapping[str, Mapping[str, str]] | None
@@ -222,7 +238,7 @@ class ListTagsParams(TypedDict, total=False):
     query: str | None
 
 
-class IterTagsParams(TypedDict, total=False):
+class IterTagsParams(IterPaginationParams, total=False):
     tag: TagType
 
 
@@ -247,6 +263,22 @@ class ListTagsWithPaginationParams(ListTagsParams, PaginationParams, total=False
     pass
 
 
+class CountParams(TypedDict, total=False):
+    cache_ttl: float | None
+
+
+class CountRecordsParams(ListRecordsParams, CountParams, total=False):
+    pass
+
+
+class CountUploadsParams(ListUploadsParams, CountParams, total=False):
+    pass
+
+
+class CountTagsParams(ListTagsParams, CountParams, total=False):
+    pass
+
+
 class ListUploadCollectionsParams(TypedDict, total=False):
     ids: Iterable[str] | None
     timeout: TimeoutTypes | None